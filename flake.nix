@@ -67,6 +67,7 @@
           mkShell {
             buildInputs = with python3Packages; [
               pytest
+              pytest-xdist
               sphinx
               sphinx_rtd_theme
               jupyterlab
@@ -1,13 +1,39 @@
 """Private helper utilities."""
 
+import numpy as np
 import pandas as pd
 
 
 def empty_mask_like(table: pd.DataFrame) -> pd.DataFrame:
     """Given a dataframe, create another just like it with every entry False."""
-    empty = pd.DataFrame(index=table.index, columns=table.columns)
-    empty.iloc[:, :] = False
-    return empty.astype(bool)
+    return pd.DataFrame(
+        np.zeros(table.shape, dtype=bool), index=table.index, columns=table.columns
+    )
+
+
+def as_mask(table: pd.DataFrame) -> pd.DataFrame:
+    """Return the table as a boolean dataframe backed by a single array.
+
+    If the table already has only boolean columns it is returned as is. Other
+    tables must hold only booleans, or numbers that are zero or one; casting
+    would otherwise turn any other value, including a missing one, into `True`.
+
+    Raises
+    ------
+    TypeError
+        If an entry of the table is not a boolean, zero, or one.
+
+    """
+    if (table.dtypes == bool).all():
+        return table
+    array = table.to_numpy()
+    if array.dtype.kind in "iuf":
+        valid = ((array == 0) | (array == 1)).all()
+    else:
+        valid = all(isinstance(x, (bool, np.bool_)) for x in array.flat)
+    if not valid:
+        raise TypeError("A mask may only contain booleans, zeros, and ones.")
+    return pd.DataFrame(array.astype(bool), index=table.index, columns=table.columns)
 
 
 def in_jupyter_notebook() -> bool:
@@ -1,5 +1,6 @@
 """Represents a collection of assignments."""
 
+import bisect
 from collections.abc import Sequence, Collection
 import typing
 
@@ -70,6 +71,13 @@ class Assignments(Sequence[str]):
     def __init__(self, names: typing.Sequence[str]):
         self._names = list(names)
 
+        # the names in sorted order and their positions, built on first use
+        self._sorted: typing.Optional[tuple[list[int], list[str]]] = None
+
+        # the results of starting_with, by prefix. the names never change, so
+        # neither do the results
+        self._starting_with: dict[str, "Assignments"] = {}
+
     def __contains__(self, element: str) -> bool:
         return element in self._names
 
@@ -99,6 +107,13 @@ class Assignments(Sequence[str]):
             p.text(f"  {name!r}\n")
         p.text("])")
 
+    def _sorted_index(self) -> tuple[list[int], list[str]]:
+        """The positions of the names in sorted order, and the sorted names."""
+        if self._sorted is None:
+            positions = sorted(range(len(self._names)), key=self._names.__getitem__)
+            self._sorted = (positions, [self._names[i] for i in positions])
+        return self._sorted
+
     def starting_with(self, prefix: str) -> "Assignments":
         """Return only those assignments starting with the prefix.
 
@@ -113,7 +128,21 @@ class Assignments(Sequence[str]):
             Only those assignments starting with the prefix.
 
         """
-        return self.__class__([x for x in self._names if x.startswith(prefix)])
+        if prefix in self._starting_with:
+            return self._starting_with[prefix]
+
+        sorted_positions, sorted_names = self._sorted_index()
+
+        # names sharing a prefix form a contiguous run in sorted order, starting at
+        # the point where the prefix itself would be inserted
+        start = stop = bisect.bisect_left(sorted_names, prefix)
+        while stop < len(sorted_names) and sorted_names[stop].startswith(prefix):
+            stop += 1
+
+        positions = sorted(sorted_positions[start:stop])
+        result = self.__class__([self._names[i] for i in positions])
+        self._starting_with[prefix] = result
+        return result
 
     def ending_with(self, suffix: str) -> "Assignments":
         """Return only those assignments ending with the suffix.
@@ -1,13 +1,15 @@
 """A type for managing a collection of grades."""
 
+import collections
 import copy
 import dataclasses
 import math
+import sys
 from typing import Sequence, Collection, Mapping, Union, Tuple, Optional
 from numbers import Real
 
-from ..scales import DEFAULT_SCALE, map_scores_to_letter_grades
-from .._util import empty_mask_like, ensure_df, ensure_series
+from ..scales import DEFAULT_SCALE, _lay_out_scale, _look_up_letter_grades
+from .._util import as_mask, empty_mask_like, ensure_series
 from ._student import Student, Students
 from ._assignments import Assignments
 
@@ -20,11 +22,11 @@ import pandas as pd
 
 def _empty_lateness_like(table: pd.DataFrame) -> pd.DataFrame:
     """Given a dataframe, create another like it with every entry a timedelta of 0."""
-    empty = table.copy()
-    empty.iloc[:, :] = 0
-    for column in empty.columns:
-        empty[column] = pd.to_timedelta(empty[column], unit="s")  # pyright: ignore
-    return empty
+    return pd.DataFrame(
+        np.zeros(table.shape, dtype="timedelta64[ns]"),
+        index=table.index,
+        columns=table.columns,
+    )
 
 
 def _cast_index_to_student_objects(table: pd.DataFrame) -> pd.DataFrame:
@@ -40,23 +42,96 @@ def _cast_index_to_student_objects(table: pd.DataFrame) -> pd.DataFrame:
     return table
 
 
+def _intern_assignment_names(columns: pd.Index) -> pd.Index:
+    """Intern the assignment names, so that equal names are the same object.
+
+    Names read from a file are otherwise distinct from the literals used to look
+    them up, and every lookup would then compare the strings character by
+    character.
+
+    """
+    return columns.map(lambda c: sys.intern(c) if type(c) is str else c)
+
+
+def _share_labels(table: pd.DataFrame, like: pd.DataFrame) -> pd.DataFrame:
+    """Make the table use the very same index and column objects as `like`.
+
+    The labels are only shared if they are equal; otherwise the table is
+    returned unchanged. The table's data is not copied, nor is the table
+    itself modified.
+
+    """
+    if not (table.index.equals(like.index) and table.columns.equals(like.columns)):
+        return table
+    table = table.copy(deep=False)
+    table.index = like.index
+    table.columns = like.columns
+    return table
+
+
+def _order_like(points_possible: pd.Series, columns: pd.Index) -> pd.Series:
+    """Put the points possible in the order of the assignment columns.
+
+    Raises
+    ------
+    ValueError
+        If the points possible are not given for exactly the assignments in
+        `columns`.
+
+    """
+    if points_possible.index.equals(columns):
+        return points_possible
+    missing = list(columns.difference(points_possible.index, sort=False))
+    extra = list(points_possible.index.difference(columns, sort=False))
+    if missing or extra:
+        raise ValueError(
+            "Points possible must be given for exactly the assignments in the "
+            f"gradebook; missing {missing}, unexpected {extra}."
+        )
+    return points_possible.reindex(columns)
+
+
+def _positions_in(reference: pd.Index, labels: Sequence):
+    """Return a function giving the positions of the labels in an index.
+
+    The positions in `reference` are computed once; they are reused for any
+    index that is the very same object, and looked up afresh in any other. A
+    `KeyError` is raised if a label is missing from an index.
+
+    """
+    reference_positions = reference.get_indexer(labels)
+
+    def positions(index: pd.Index) -> np.ndarray:
+        result = (
+            reference_positions if index is reference else index.get_indexer(labels)
+        )
+        if (result < 0).any():
+            missing = [label for label, p in zip(labels, result) if p < 0]
+            raise KeyError(f"Labels {missing} are not in the table.")
+        return result
+
+    return positions
+
+
+def _copy_attribute(obj):
+    """Copy a gradebook attribute, using its own copy method if it has one."""
+    if hasattr(obj, "copy"):
+        return obj.copy()
+    else:
+        return copy.deepcopy(obj)
+
+
 def _concatenate_notes(
     gradebooks: Sequence["Gradebook"],
 ) -> dict[Student, dict[str, list[str]]]:
     """Concatenates the notes from a sequence of gradebooks."""
-    notes = {}
+    notes = collections.defaultdict(lambda: collections.defaultdict(list))
     for gradebook in gradebooks:
         for pid, channels_dct in gradebook.notes.items():
-            if pid not in notes:
-                notes[pid] = {}
-
             for channel, messages in channels_dct.items():
-                if channel not in notes[pid]:
-                    notes[pid][channel] = []
-
                 notes[pid][channel].extend(messages)
 
-    return notes
+    return {pid: dict(channels) for pid, channels in notes.items()}
 
 
 def _combine_if_equal(gradebooks: Collection["Gradebook"], attr: str):
@@ -103,6 +178,60 @@ def _copy_notes(
     return result
 
 
+def _lay_out_groups(groups: Mapping[str, "GradingGroup"]) -> tuple:
+    """Lay grading groups out end to end in flat arrays.
+
+    Returns the assignment names, group after group, along with the offset at
+    which each group starts (followed by the total length), the weight of each
+    assignment within its group, and the weight of each group.
+
+    """
+    assignments = [a for g in groups.values() for a in g.assignment_weights]
+    group_offsets = np.cumsum(
+        [0] + [len(g.assignment_weights) for g in groups.values()]
+    )
+    assignment_weights = np.fromiter(
+        (w for g in groups.values() for w in g.assignment_weights.values()),
+        dtype=float,
+        count=len(assignments),
+    )
+    group_weights = np.fromiter(
+        (g.group_weight for g in groups.values()), dtype=float, count=len(groups)
+    )
+    return assignments, group_offsets, assignment_weights, group_weights
+
+
+def _proportional_weights(possible: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Weight the assignments at `positions` by their share of the points possible."""
+    selected = possible[positions]
+    return selected / selected.sum()
+
+
+def _renormalize(
+    kept: np.ndarray,
+    values: np.ndarray,
+    group_columns: np.ndarray,
+    group_offsets: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Share each group's values among the assignments each student has kept.
+
+    Groups are laid out end to end: the columns of group `g` are
+    ``group_columns[group_offsets[g]:group_offsets[g + 1]]``, and `values`
+    holds one entry per position in `group_columns`.
+
+    Returns
+    -------
+    kept_values : numpy.ndarray
+        A students-by-positions array of the values, zeroed where dropped.
+    totals : numpy.ndarray
+        A students-by-groups array of the kept values in each group.
+
+    """
+    kept_values = kept[:, group_columns] * values
+    totals = np.add.reduceat(kept_values, group_offsets[:-1], axis=1)
+    return kept_values, totals
+
+
 # public functions =====================================================================
 
 
@@ -142,9 +271,8 @@ def combine_gradebooks(gradebooks: Collection["Gradebook"], restrict_to_students
         assignment name; the options do not match; the scales do not match.
 
     """
-    gradebooks = [g.copy() for g in gradebooks]
-
     if restrict_to_students is not None:
+        gradebooks = [g.copy() for g in gradebooks]
         for gradebook in gradebooks:
             gradebook.restrict_to_students(restrict_to_students)
 
@@ -163,23 +291,35 @@ def combine_gradebooks(gradebooks: Collection["Gradebook"], restrict_to_students
     if len(unique_assignments) != number_of_assignments:
         raise ValueError("Gradebooks have duplicate assignments.")
 
-    # create the combined notebook
-    def concatenate_table_attr(a: str, axis=1):
-        """Create a DF/Series by combining the same attribute across gradebooks."""
-        all_tables = [getattr(gb, a) for gb in gradebooks]
-        return pd.concat(all_tables, axis=axis)
+    # create the combined notebook. every table is put in the student order of
+    # the first gradebook and the arrays are stacked side by side in one copy
+    index = gradebooks[0].points_earned.index
+    columns = gradebooks[0].points_earned.columns.append(
+        [g.points_earned.columns for g in gradebooks[1:]]
+    )
+
+    def concatenate_table_attr(a: str) -> pd.DataFrame:
+        """Create a DF by combining the same attribute across gradebooks."""
+        arrays = []
+        for gradebook in gradebooks:
+            table = getattr(gradebook, a)
+            array = table.to_numpy()
+            if not table.index.equals(index):
+                array = array[table.index.get_indexer(index)]
+            arrays.append(array)
+        return pd.DataFrame(np.hstack(arrays), index=index, columns=columns)
 
     return Gradebook(
-        points_earned=ensure_df(concatenate_table_attr("points_earned")),
+        points_earned=concatenate_table_attr("points_earned"),
         points_possible=ensure_series(
-            concatenate_table_attr("points_possible", axis=0)
+            pd.concat([g.points_possible for g in gradebooks])
         ),
-        lateness=ensure_df(concatenate_table_attr("lateness")),
-        dropped=ensure_df(concatenate_table_attr("dropped")),
+        lateness=concatenate_table_attr("lateness"),
+        dropped=concatenate_table_attr("dropped"),
         notes=_concatenate_notes(gradebooks),
         grading_groups={},
-        options=_combine_if_equal(gradebooks, "options"),
-        scale=_combine_if_equal(gradebooks, "scale"),
+        options=_copy_attribute(_combine_if_equal(gradebooks, "options")),
+        scale=_copy_attribute(_combine_if_equal(gradebooks, "scale")),
     )
 
 
@@ -364,6 +504,15 @@ class Gradebook:
         "options",
     ]
 
+    # the attributes set by _clear_caches, which are left out of pickles
+    _cache_names = (
+        "_assignments",
+        "_students",
+        "_scale_layout",
+        "_version",
+        "_derived_cache",
+    )
+
     def __init__(
         self,
         points_earned: pd.DataFrame,
@@ -376,18 +525,69 @@ class Gradebook:
         options: Optional[GradebookOptions] = None,
     ):
         self.options = options if options is not None else GradebookOptions()
+        self._clear_caches()
         self.points_earned = _cast_index_to_student_objects(points_earned).astype(float)
-        self.points_possible = points_possible.astype(float)
+        self.points_earned.columns = _intern_assignment_names(
+            self.points_earned.columns
+        )
+        # points possible is read by position alongside the points earned, so it
+        # is put in the same order as the columns
+        self.points_possible = _order_like(
+            points_possible.astype(float), self.points_earned.columns
+        )
         self.lateness = (
             lateness if lateness is not None else _empty_lateness_like(points_earned)
         )
         self.dropped = (
-            dropped if dropped is not None else empty_mask_like(points_earned)
+            dropped if dropped is not None else empty_mask_like(self.points_earned)
         )
+        self._align_labels()
+
         self.notes = {} if notes is None else _copy_notes(notes)
         self.grading_groups = {} if grading_groups is None else grading_groups
         self.scale = DEFAULT_SCALE if scale is None else scale
 
+    def _clear_caches(self):
+        """Start the gradebook over with empty caches."""
+        self._assignments = None
+        self._students = None
+        self._scale_layout = None
+        self._version = 0
+        self._derived_cache = {}
+
+    def __getstate__(self):
+        """The state to pickle: everything but the caches."""
+        state = self.__dict__.copy()
+        for name in self._cache_names:
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        """Restore a pickled gradebook, including one pickled by an earlier version.
+
+        The caches are rebuilt from scratch whatever the version. Earlier
+        versions kept the tables in plain attributes, and some pickled their
+        caches along with them; those are discarded.
+
+        """
+        state = dict(state)
+        for name in ("points_earned", "points_possible", "dropped"):
+            if name in state:
+                state["_" + name] = state.pop(name)
+        for name in (*self._cache_names, "_groups_layout"):
+            state.pop(name, None)
+        self.__dict__.update(state)
+
+        self._clear_caches()
+        self.points_earned.columns = _intern_assignment_names(
+            self.points_earned.columns
+        )
+        self.points_possible = _order_like(
+            self.points_possible, self.points_earned.columns
+        )
+        self.dropped = self._dropped
+        self._align_labels()
+
     def __repr__(self):
         return (
             f"<{self.__class__.__name__} object with "
@@ -395,6 +595,67 @@ class Gradebook:
             f"and {len(self.pids)} students>"
         )
 
+    @classmethod
+    def from_arrays(
+        cls,
+        points_earned,
+        points_possible,
+        students: Sequence[Union[Student, str]],
+        assignments: Sequence[str],
+        lateness=None,
+        dropped=None,
+        **kwargs,
+    ) -> "Gradebook":
+        """Create a gradebook from arrays and the labels of their rows and columns.
+
+        This is a convenience for building a gradebook from data that is not
+        already in tables. The arrays are wrapped in dataframes that all share
+        the same index and columns.
+
+        Parameters
+        ----------
+        points_earned : array-like
+            A two-dimensional array of points earned, with one row per student
+            and one column per assignment.
+        points_possible : array-like
+            The points possible for each assignment.
+        students : Sequence[Union[Student, str]]
+            The students, in the order of the rows. Strings are interpreted
+            as PIDs.
+        assignments : Sequence[str]
+            The assignment names, in the order of the columns.
+        lateness : Optional[array-like]
+            A two-dimensional array of timedeltas. If not provided, no
+            assignment is late.
+        dropped : Optional[array-like]
+            A two-dimensional array of booleans. If not provided, no assignment
+            is dropped.
+        **kwargs
+            Any other arguments accepted by :class:`Gradebook`.
+
+        Returns
+        -------
+        Gradebook
+
+        """
+        index = pd.Index(
+            [s if isinstance(s, Student) else Student(s) for s in students]
+        )
+        columns = pd.Index(assignments)
+
+        def _table(array, dtype):
+            return pd.DataFrame(
+                np.asarray(array, dtype=dtype), index=index, columns=columns
+            )
+
+        return cls(
+            _table(points_earned, float),
+            pd.Series(np.asarray(points_possible, dtype=float), index=columns),
+            lateness=None if lateness is None else _table(lateness, "timedelta64[ns]"),
+            dropped=None if dropped is None else _table(dropped, bool),
+            **kwargs,
+        )
+
     # properties: assignments, students, lates -----------------------------------------
 
     @property
@@ -408,7 +669,12 @@ class Gradebook:
         Assignments
 
         """
-        return Assignments(list(self.points_earned.columns))
+        # the columns are never modified in place, only replaced, so the
+        # Assignments built from them can be reused until they are
+        columns = self._points_earned.columns
+        if self._assignments is None or self._assignments[0] is not columns:
+            self._assignments = (columns, Assignments(list(columns)))
+        return self._assignments[1]
 
     @property
     def pids(self) -> set[str]:
@@ -421,7 +687,7 @@ class Gradebook:
         set
 
         """
-        return set(self.points_earned.index)
+        return set(self._points_earned.index)
 
     @property
     def students(self) -> Students:
@@ -437,7 +703,11 @@ class Gradebook:
         Students
 
         """
-        return Students([s for s in self.points_earned.index])
+        # like the assignments, reused for as long as the index is the same object
+        index = self._points_earned.index
+        if self._students is None or self._students[0] is not index:
+            self._students = (index, Students(list(index)))
+        return self._students[1]
 
     @property
     def late(self) -> pd.DataFrame:
@@ -455,8 +725,83 @@ class Gradebook:
         This is a derived attribute; it should not be modified.
 
         """
-        fudge = self.options.lateness_fudge
-        return self.lateness > pd.Timedelta(fudge, unit="s")
+        fudge = pd.Timedelta(self.options.lateness_fudge, unit="s").to_timedelta64()
+        lateness = self.lateness.to_numpy(dtype="timedelta64[ns]")
+        return pd.DataFrame(
+            lateness > fudge, index=self.lateness.index, columns=self.lateness.columns
+        )
+
+    # properties: tables ---------------------------------------------------------------
+
+    @property
+    def points_earned(self) -> pd.DataFrame:
+        """A dataframe of the points earned by each student on each assignment.
+
+        It may be modified in place or replaced.
+
+        """
+        self._touch()
+        return self._points_earned
+
+    @points_earned.setter
+    def points_earned(self, value: pd.DataFrame):
+        self._points_earned = value
+        self._touch()
+
+    @property
+    def points_possible(self) -> pd.Series:
+        """A series of the points possible on each assignment.
+
+        It may be modified in place or replaced.
+
+        """
+        self._touch()
+        return self._points_possible
+
+    @points_possible.setter
+    def points_possible(self, value: pd.Series):
+        self._points_possible = value
+        self._touch()
+
+    @property
+    def dropped(self) -> pd.DataFrame:
+        """A boolean dataframe telling which assignments are dropped.
+
+        Will have the same index and columns as the `points_earned` attribute.
+        It may be modified in place, as the policies do, or replaced. A
+        replacement is converted to a boolean table backed by a single array,
+        and shares its labels with `points_earned` when they are equal.
+
+        """
+        self._touch()
+        return self._dropped
+
+    @dropped.setter
+    def dropped(self, value: pd.DataFrame):
+        self._dropped = _share_labels(as_mask(value), self._points_earned)
+        self._touch()
+
+    def _touch(self):
+        """Note that the tables may have changed since the derived tables were cached.
+
+        Every setter calls this, and so does every getter of a table that may be
+        edited in place once handed out, since the gradebook cannot see those
+        edits.
+
+        """
+        self._version += 1
+
+    def _align_labels(self):
+        """Make the tables share the index and column objects of `points_earned`.
+
+        Labels are only shared where they are equal. Checking that the tables
+        are aligned is then usually a matter of identity.
+
+        """
+        self.lateness = _share_labels(self.lateness, self.points_earned)
+        self._dropped = _share_labels(self._dropped, self.points_earned)
+        if self.points_possible.index.equals(self.points_earned.columns):
+            self.points_possible.index = self.points_earned.columns
 
     # properties: groups ---------------------------------------------------------------
 
@@ -516,6 +861,8 @@ class Gradebook:
             ... }
 
         """
+        # the groups themselves may be edited in place
+        self._touch()
         return dict(self._groups)
 
     @grading_groups.setter
@@ -576,21 +923,25 @@ class Gradebook:
                 raise ValueError(f'Grading group "{name}" is empty.')
 
             if not isinstance(assignment_weights, dict):
-                # an iterable of assignments that we need to turn into a dict
-                total_points_possible = sum(
-                    self.points_possible[a] for a in assignment_weights
+                # an iterable of assignments that we need to turn into a dict,
+                # weighting each assignment by its share of the points possible
+                weights = _proportional_weights(
+                    self._points_possible_array(),
+                    self._assignment_positions(assignment_weights),
                 )
-                assignment_weights = {
-                    a: self.points_possible[a] / total_points_possible
-                    for a in assignment_weights
-                }
+                assignment_weights = dict(zip(assignment_weights, weights.tolist()))
 
             return GradingGroup(assignment_weights, float(group_weight))
 
-        new_groups = {name: _make_group(g, name) for name, g in value.items()}
+        # groups are built, checked for emptiness, and their weights summed in a
+        # single pass over the definitions
+        new_groups = {}
+        total_weight = 0.0
+        for name, g in value.items():
+            group = new_groups[name] = _make_group(g, name)
+            total_weight += group.group_weight
 
         if new_groups:
-            total_weight = sum(g.group_weight for g in new_groups.values())
             if self.options.allow_extra_credit:
                 if total_weight < 1:
                     raise ValueError("Group weights must sum to >= 1.")
@@ -601,6 +952,7 @@ class Gradebook:
                 )
 
         self._groups = new_groups
+        self._touch()
 
     # properties: weights and values ---------------------------------------------------
 
@@ -633,19 +985,153 @@ class Gradebook:
             the weights are undefined.
 
         """
-        result = self.points_possible / self._by_grading_group_to_by_assignment(
-            self._points_possible_in_grading_group_after_drops
+        return self._grading_matrices()[0].copy()
+
+    def _grading_matrices(
+        self,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.Series]:
+        """The cached :attr:`weight_in_group`, :attr:`overall_weight`,
+        :attr:`value`, :attr:`grading_group_scores`, and :attr:`overall_score`.
+
+        The cached tables themselves are returned; copy a table before handing it
+        out so that callers cannot alter the cache.
+
+        """
+        return self._cached("grading_matrices", self._compute_grading_matrices)
+
+    def _compute_grading_matrices(
+        self,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.Series]:
+        """Computes :attr:`weight_in_group`, :attr:`overall_weight`,
+        :attr:`value`, :attr:`grading_group_scores`, and :attr:`overall_score`
+        together, bypassing the cache.
+
+        """
+        kept = ~self._dropped.to_numpy(dtype=bool)
+        points_possible = self._points_possible_array()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = self._points_earned.to_numpy() / points_possible
+        weight_in_group = np.full(kept.shape, np.nan)
+        group_weight = np.full(kept.shape[1], np.nan)
+        group_scores = np.empty((kept.shape[0], 0))
+        overall_score = np.zeros(kept.shape[0])
+
+        if self._groups:
+            (
+                group_columns,
+                group_offsets,
+                assignment_weights,
+                group_weights,
+            ) = self._group_layout()
+            group_sizes = np.diff(group_offsets)
+
+            _, possible_after_drops = _renormalize(
+                kept, points_possible[group_columns], group_columns, group_offsets
+            )
+            all_dropped = possible_after_drops == 0
+            if all_dropped.any():
+                # report the first group in which a student has dropped everything
+                first = all_dropped.any(axis=0).argmax()
+                group_name = list(self._groups)[first]
+                problematic_pids = list(
+                    self._points_earned.index[all_dropped[:, first]]
+                )
+                raise ValueError(
+                    f"All assignments are dropped for {problematic_pids} in group '{group_name}'."
+                )
+
+            # renormalize the weights of the assignments that remain after drops
+            kept_weights, weight_after_drops = _renormalize(
+                kept, assignment_weights, group_columns, group_offsets
+            )
+            with np.errstate(invalid="ignore"):
+                weights = kept_weights / np.repeat(
+                    weight_after_drops, group_sizes, axis=1
+                )
+            weight_in_group[:, group_columns] = weights
+            group_weight[group_columns] = np.repeat(group_weights, group_sizes)
+
+            # a group's score is the weighted sum of the scores on its assignments;
+            # missing scores (and the scores of dropped assignments) contribute zero
+            with np.errstate(invalid="ignore"):
+                weighted_scores = scores[:, group_columns] * weights
+            weighted_scores[np.isnan(weighted_scores)] = 0
+            group_scores = np.add.reduceat(weighted_scores, group_offsets[:-1], axis=1)
+            overall_score = group_scores @ group_weights
+
+        overall_weight = weight_in_group * group_weight
+        with np.errstate(invalid="ignore"):
+            value = scores * overall_weight
+
+        index, columns = self._points_earned.index, self._points_earned.columns
+        return (
+            pd.DataFrame(weight_in_group, index=index, columns=columns),
+            pd.DataFrame(overall_weight, index=index, columns=columns),
+            pd.DataFrame(value, index=index, columns=columns),
+            pd.DataFrame(group_scores, index=index, columns=list(self._groups)),
+            pd.Series(overall_score, index=index),
         )
 
-        for _, group in self.grading_groups.items():
-            if isinstance(group.assignment_weights, dict):
-                weights = pd.Series(group.assignment_weights)
-                weights = self._everyone_to_per_student(weights)
-                weights = weights * ~self.dropped[list(group.assignment_weights)]
-                weights = (weights.T / weights.sum(axis=1)).T
-                result.loc[:, list(group.assignment_weights)] = weights
+    def _group_layout(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """The grading groups laid out end to end, as used by :func:`_renormalize`.
+
+        The groups may have been edited in place, so the layout is rebuilt by
+        :func:`_lay_out_groups` each time; this is only done when the derived
+        tables are recomputed.
+
+        Returns
+        -------
+        group_columns : numpy.ndarray
+            The column position of each assignment, group after group.
+        group_offsets : numpy.ndarray
+            Where each group starts in `group_columns`, followed by its length.
+        assignment_weights : numpy.ndarray
+            The weight of each assignment within its group.
+        group_weights : numpy.ndarray
+            The weight of each group.
+
+        """
+        (
+            assignments,
+            group_offsets,
+            assignment_weights,
+            group_weights,
+        ) = _lay_out_groups(self._groups)
+        group_columns = self._assignment_positions(assignments)
+        return group_columns, group_offsets, assignment_weights, group_weights
+
+    def _points_possible_array(self) -> np.ndarray:
+        """The points possible, in the order of the :attr:`points_earned` columns.
+
+        :attr:`points_possible` is public and may be replaced by a series in
+        another order, so it is aligned by label before being read by position.
+
+        Raises
+        ------
+        ValueError
+            If the points possible are not given for exactly the assignments in
+            the gradebook.
+
+        """
+        return _order_like(
+            self._points_possible, self._points_earned.columns
+        ).to_numpy()
+
+    def _assignment_positions(self, assignments: Collection[str]) -> np.ndarray:
+        """The column positions of the given assignments in :attr:`points_earned`.
 
-        return result * (~self.dropped)
+        Raises
+        ------
+        KeyError
+            If any of the assignments is not in the gradebook.
+
+        """
+        assignments = list(assignments)
+        positions = self._points_earned.columns.get_indexer(assignments)
+        if (positions < 0).any():
+            missing = [a for a, p in zip(assignments, positions) if p < 0]
+            raise KeyError(f"Assignments {missing} are not in the gradebook.")
+        return positions
 
     @property
     def overall_weight(self) -> pd.DataFrame:
@@ -676,17 +1162,7 @@ class Gradebook:
             the weights are undefined.
 
         """
-
-        group_weight = pd.Series(
-            {
-                group_name: assignment_group.group_weight
-                for group_name, assignment_group in self.grading_groups.items()
-            },
-            dtype=float,
-        )
-        return self.weight_in_group * self._by_grading_group_to_by_assignment(
-            group_weight
-        )
+        return self._grading_matrices()[1].copy()
 
     @property
     def value(self) -> pd.DataFrame:
@@ -712,49 +1188,28 @@ class Gradebook:
             the weights are undefined.
 
         """
-        return (self.points_earned / self.points_possible) * self.overall_weight
+        return self._grading_matrices()[2].copy()
 
-    # properties: scores ---------------------------------------------------------------
+    def _cached(self, name: str, compute):
+        """Return a derived result, computing it only if the gradebook has changed.
 
-    @property
-    def _points_possible_in_grading_group_after_drops(self) -> pd.DataFrame:
-        """A table of the number of points possible in an assignment group, after drops.
-
-        Produces a table with one row per student, and one column per assignment group,
-        containing the number of points possible in that group after dropped assignments
-        have been removed.
-
-        This is a derived attribute; it should not be modified.
-
-        Raises
-        ------
-        ValueError
-            If all assignments in an assignment group have been dropped for a student.
+        A cached result is kept along with the version of the gradebook it was
+        computed from, and is reused only while that version is current. The
+        version is bumped by :meth:`_touch` whenever a table is set or handed out
+        to be read (and perhaps edited in place, as the policies edit
+        ``dropped``), so ``compute`` must itself read only the private tables.
+        An edit made through a reference to a table obtained *before* the
+        derived table was last read goes unnoticed. The cached object itself is
+        returned; callers are responsible for copying it before handing it out.
 
         """
-        result = {}
-        for group_name, group in self.grading_groups.items():
-            possible = pd.DataFrame(
-                np.tile(
-                    self.points_possible[list(group.assignment_weights)],
-                    (self.points_earned.shape[0], 1),
-                ),
-                index=pd.Index(self.students),
-                columns=list(group.assignment_weights),
-            )
-
-            possible[self.dropped[list(group.assignment_weights)]] = 0
-            possible = possible.sum(axis=1)
-
-            if (possible == 0).any():
-                problematic_pids = list(possible.index[possible == 0])
-                raise ValueError(
-                    f"All assignments are dropped for {problematic_pids} in group '{group_name}'."
-                )
-
-            result[group_name] = possible
+        cached = self._derived_cache.get(name)
+        if cached is None or cached[0] != self._version:
+            cached = (self._version, compute())
+            self._derived_cache[name] = cached
+        return cached[1]
 
-        return pd.DataFrame(result, index=pd.Index(self.students))
+    # properties: scores ---------------------------------------------------------------
 
     @property
     def grading_group_scores(self) -> pd.DataFrame:
@@ -771,83 +1226,13 @@ class Gradebook:
         individual assignment may not be attempted by a student, but a grading
         group score is always "attempted" and so it cannot be `NaN`.
 
-        If :attr:`grading_groups` has not yet been set, all entries are `NaN`.
+        If :attr:`grading_groups` has not yet been set, the table has no
+        columns.
 
         This is a derived attribute; it should not be modified.
 
         """
-        group_values = pd.DataFrame(
-            {
-                group_name: self.value[list(group.assignment_weights)].sum(axis=1)
-                for group_name, group in self.grading_groups.items()
-            }
-        )
-        group_weight = pd.Series(
-            {
-                group_name: group.group_weight
-                for group_name, group in self.grading_groups.items()
-            }
-        )
-        return group_values / group_weight
-
-    def _by_grading_group_to_by_assignment(self, by_group) -> pd.DataFrame:
-        """Creates a students-by-assignments table from a students-by-groups table by tiling.
-
-        Parameters
-        ----------
-        by_group
-            Can be a Series or a DataFrame. If it is a DataFrame, it should
-            have group names as columns and students in the index. Each
-            column is "expanded" by creating a new column for each
-            assignment in the group whose value is a copy of the group's
-            column in the input. If a Series, it should have group names as
-            its index. The Series is first converted to a students-by-groups
-            dataframe by copying the group value for each student, then to a
-            (student, assignments) dataframe using the above procedure.
-
-        Returns
-        -------
-        DataFrame
-
-        """
-
-        def _convert_df(df):
-            """Converts a students-by-groups dataframe to a students-by-assignments dataframe."""
-            new_columns = {}
-            for group_name in df.columns:
-                for assignment in self.grading_groups[group_name].assignment_weights:
-                    new_columns[assignment] = df[group_name]
-            return pd.DataFrame(new_columns, index=pd.Index(self.students))
-
-        def _convert_series(s):
-            """Converts a Series with group names as its index to a students-by-assignments dataframe."""
-            new_columns = {}
-            for group_name in s.index:
-                new_columns[group_name] = np.repeat(
-                    s[group_name], len(self.points_earned)
-                )
-            df = pd.DataFrame(new_columns, index=pd.Index(self.students))
-            return _convert_df(df)
-
-        if isinstance(by_group, pd.Series):
-            return _convert_series(by_group)
-        else:
-            return _convert_df(by_group)
-
-    def _everyone_to_per_student(self, s: pd.Series) -> pd.DataFrame:
-        """Converts a (groups,) or (assignments,) Series to a (students, *) DataFrame.
-
-        That is, given a Series with group or assignment names as its index,
-        creates a DataFrame with one row per student and one column per group
-        or assignment, where each entry is the value of the Series for that
-        group or assignment (each row is a copy of the Series).
-
-        """
-        return pd.DataFrame(
-            np.tile(np.array(s.values), (len(self.points_earned), 1)),
-            columns=s.index,
-            index=pd.Index(self.students),
-        )
+        return self._grading_matrices()[3].copy()
 
     @property
     def attempted(self) -> pd.DataFrame:
@@ -886,7 +1271,8 @@ class Gradebook:
         A pandas Series with an entry for each student in the Gradebook. The
         index is the same as the series returned by the :attr:`students`
         attribute. Each entry is the overall score in the class, taking drops
-        into account.
+        into account: the student's :attr:`grading_group_scores` weighted by
+        the weights of the groups.
 
         This is a derived attribute; it should not be modified.
 
@@ -896,12 +1282,12 @@ class Gradebook:
             If :attr:`grading_groups` has not yet been set.
 
         """
-        if not self.grading_groups:
+        if not self._groups:
             raise ValueError(
                 "Grading groups should be set before calculating letter grades."
             )
 
-        return self.value.sum(axis=1)
+        return self._grading_matrices()[4].copy()
 
     # properties: letter grades --------------------------------------------------------
 
@@ -922,12 +1308,28 @@ class Gradebook:
             If :attr:`grading_groups` has not yet been set.
 
         """
-        if not self.grading_groups:
+        if not self._groups:
             raise ValueError(
                 "Grading groups should be set before calculating letter grades."
             )
 
-        return map_scores_to_letter_grades(self.overall_score, scale=self.scale)
+        # the letters are looked up with a binary search over the scale; the
+        # cached scores are only read, so they need not be copied first
+        overall_score = self._grading_matrices()[4]
+        return _look_up_letter_grades(overall_score, *self._laid_out_scale())
+
+    def _laid_out_scale(self) -> Tuple[np.ndarray, np.ndarray]:
+        """The scale, validated and laid out in arrays for looking up letters.
+
+        The layout is kept along with the scale's entries at the time, and is
+        only redone when they change, whether the scale was replaced or edited
+        in place.
+
+        """
+        entries = tuple(self.scale.items())
+        if self._scale_layout is None or self._scale_layout[0] != entries:
+            self._scale_layout = (entries, _lay_out_scale(self.scale))
+        return self._scale_layout[1]
 
     # copying / replacing --------------------------------------------------------------
 
@@ -941,18 +1343,12 @@ class Gradebook:
         extra = set(kwargs.keys()) - set(self._kwarg_names)
         assert not extra, f"Invalid kwargs provided: {extra}"
 
-        def _copy(obj):
-            if hasattr(obj, "copy"):
-                return obj.copy()
-            else:
-                return copy.deepcopy(obj)
-
         new_kwargs = {}
         for kwarg_name in self._kwarg_names:
             if kwarg_name in kwargs:
                 new_kwargs[kwarg_name] = kwargs[kwarg_name]
             else:
-                new_kwargs[kwarg_name] = _copy(getattr(self, kwarg_name))
+                new_kwargs[kwarg_name] = _copy_attribute(getattr(self, kwarg_name))
 
         return self.__class__(**new_kwargs)
 
@@ -1011,16 +1407,22 @@ class Gradebook:
         if name in self.assignments:
             raise ValueError(f'An assignment with the name "{name}" already exists.')
 
+        index = self.points_earned.index
+
         if lateness is None:
-            lateness = pd.to_timedelta(pd.Series(0, index=self.students), unit="s")
+            lateness = pd.to_timedelta(pd.Series(0, index=index), unit="s")
 
         if dropped is None:
-            dropped = pd.Series(False, index=self.students)
+            dropped = pd.Series(False, index=index)
 
         def _match_pids(pids, where):
             """Ensure that pids match."""
+            # the common case: the series is labeled exactly like the gradebook
+            if pids is index or pids.equals(index):
+                return
+
             theirs = set(pids)
-            ours = set(self.pids)
+            ours = set(index)
             if theirs - ours:
                 raise ValueError(f'Unknown pids {theirs - ours} provided in "{where}".')
             if ours - theirs:
@@ -1030,10 +1432,16 @@ class Gradebook:
         _match_pids(lateness.index, "late")
         _match_pids(dropped.index, "dropped")
 
-        self.points_earned[name] = points_earned
+        if type(name) is str:
+            name = sys.intern(name)
+
+        # each new column is appended without copying the existing ones. casting
+        # it to the table's dtype keeps every table homogeneous, so that reading
+        # it as a single array never needs a mixed-type conversion
+        self.points_earned[name] = points_earned.astype(float)
         self.points_possible[name] = float(points_possible)
         self.lateness[name] = lateness
-        self.dropped[name] = dropped
+        self.dropped[name] = dropped.astype(bool)
 
     def restrict_to_assignments(self, assignments: Collection[str]):
         """Restrict the gradebook to only the supplied assignments, removing all others.
@@ -1050,14 +1458,20 @@ class Gradebook:
 
         """
         assignments = list(assignments)
-        extras = set(assignments) - set(self.assignments)
-        if extras:
-            raise KeyError(f"These assignments were not in the gradebook: {extras}.")
-
-        self.points_earned = self.points_earned.loc[:, assignments]
-        self.points_possible = self.points_possible.loc[assignments]
-        self.lateness = self.lateness.loc[:, assignments]
-        self.dropped = ensure_df(self.dropped.loc[:, assignments])
+        self._check_assignments_exist(assignments)
+
+        # the tables usually share their columns, so the positions of the
+        # assignments are looked up once and reused
+        positions = _positions_in(self.points_earned.columns, assignments)
+        self.points_earned = self.points_earned.iloc[
+            :, positions(self.points_earned.columns)
+        ]
+        self.points_possible = self.points_possible.iloc[
+            positions(self.points_possible.index)
+        ]
+        self.lateness = self.lateness.iloc[:, positions(self.lateness.columns)]
+        self.dropped = self.dropped.iloc[:, positions(self.dropped.columns)]
+        self._align_labels()
 
         self.grading_groups = {}
 
@@ -1076,13 +1490,17 @@ class Gradebook:
 
         """
         assignments = list(assignments)
-        extras = set(assignments) - set(self.assignments)
-        if extras:
-            raise KeyError(f"These assignments were not in the gradebook: {extras}.")
+        self._check_assignments_exist(assignments)
 
-        return self.restrict_to_assignments(
-            list(set(self.assignments) - set(assignments))
-        )
+        columns = self.points_earned.columns
+        return self.restrict_to_assignments(columns[~columns.isin(assignments)])
+
+    def _check_assignments_exist(self, assignments: Sequence[str]):
+        """Raise a `KeyError` if any of the assignments is not in the gradebook."""
+        known = pd.Index(assignments).isin(self.points_earned.columns)
+        if not known.all():
+            extras = {a for a, k in zip(assignments, known) if not k}
+            raise KeyError(f"These assignments were not in the gradebook: {extras}.")
 
     def rename_assignments(self, mapping: Mapping[str, str]):
         """Renames assignments.
@@ -1135,9 +1553,53 @@ class Gradebook:
         if extras:
             raise KeyError(f"These students were not in the gradebook: {extras}.")
 
-        self.points_earned = self.points_earned.loc[pids]
-        self.lateness = self.lateness.loc[pids]
-        self.dropped = self.dropped.loc[pids]
+        positions = _positions_in(self.points_earned.index, pids)
+        self.points_earned = self.points_earned.iloc[
+            positions(self.points_earned.index)
+        ]
+        self.lateness = self.lateness.iloc[positions(self.lateness.index)]
+        self.dropped = self.dropped.iloc[positions(self.dropped.index)]
+        self._align_labels()
+
+    # dropping -------------------------------------------------------------------------
+
+    def mark_dropped(self, pairs: Collection[Tuple[Union[str, Student], str]]) -> None:
+        """Mark assignments as dropped for particular students.
+
+        Modifies the gradebook in-place. The positions of every pair are looked
+        up at once, and the :attr:`dropped` table is replaced in a single step,
+        rather than being written one entry at a time.
+
+        Parameters
+        ----------
+        pairs : Collection[Tuple[Union[str, Student], str]]
+            The (student, assignment) pairs to mark as dropped. Students may be
+            given as PIDs or as :class:`Student` instances.
+
+        Raises
+        ------
+        KeyError
+            If a student or assignment is not in the gradebook.
+
+        """
+        pairs = list(pairs)
+        rows = self._dropped.index.get_indexer(
+            [s.pid if isinstance(s, Student) else s for s, _ in pairs]
+        )
+        columns = self._dropped.columns.get_indexer([a for _, a in pairs])
+
+        if (rows < 0).any():
+            extras = {s for (s, _), r in zip(pairs, rows) if r < 0}
+            raise KeyError(f"These students were not in the gradebook: {extras}.")
+        if (columns < 0).any():
+            extras = {a for (_, a), c in zip(pairs, columns) if c < 0}
+            raise KeyError(f"These assignments were not in the gradebook: {extras}.")
+
+        mask = self._dropped.to_numpy(dtype=bool, copy=True)
+        mask[rows, columns] = True
+        self.dropped = pd.DataFrame(
+            mask, index=self._dropped.index, columns=self._dropped.columns
+        )
 
     # notes ----------------------------------------------------------------------------
 
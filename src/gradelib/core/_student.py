@@ -1,5 +1,6 @@
 """Represent a student in the class."""
 
+import sys
 from typing import Optional, Sequence
 
 
@@ -35,10 +36,21 @@ class Student:
 
     """
 
+    __slots__ = ("pid", "name")
+
     def __init__(self, pid: str, name: Optional[str] = None):
-        self.pid = pid
+        # pids are interned, so that the same pid read from different tables is
+        # the same string, and comparing them is usually a matter of identity
+        self.pid = sys.intern(pid) if type(pid) is str else pid
         self.name = name
 
+    def __setstate__(self, state):
+        """Restore a pickled student, including one pickled before slots were used."""
+        if isinstance(state, tuple):
+            # slotted instances pickle as (None, {slot: value})
+            state = state[1]
+        self.__init__(state["pid"], state.get("name"))
+
     def __repr__(self):
         """String representation uses name, if available; PID otherwise."""
         if self.name is not None:
@@ -54,7 +66,7 @@ class Student:
     def __eq__(self, other):
         """Equality checks always use the pid."""
         if isinstance(other, Student):
-            return other.pid == self.pid
+            return other.pid is self.pid or other.pid == self.pid
         else:
             return self.pid == other
 
@@ -1,6 +1,7 @@
 import itertools
 from typing import Optional, Collection
 
+import numpy as _np
 import pandas as _pd
 
 from ..core import Gradebook
@@ -46,6 +47,8 @@ def drop_most_favorable(
     ------
     ValueError
         If `within` is empty, or if n is not a positive integer.
+    KeyError
+        If an assignment in `within` is not in the gradebook.
 
     """
     if within is None:
@@ -54,30 +57,32 @@ def drop_most_favorable(
     # the combinations of assignments to drop
     combinations = list(itertools.combinations(within, n))
 
+    # each combination as a mask over the assignments, one row per combination
+    columns = gradebook.dropped.columns
+    combination_masks = _np.zeros((len(combinations), len(columns)), dtype=bool)
+    for i, possibly_dropped in enumerate(combinations):
+        positions = columns.get_indexer(possibly_dropped)
+        if (positions < 0).any():
+            raise KeyError(f"Assignments {possibly_dropped} are not in the gradebook.")
+        combination_masks[i, positions] = True
+
     # we'll repeatedly replace this gradebook's dropped attribute
     testbed = gradebook.copy()
 
     # we will try each combination and compute the resulting score for each student
     scores = []
-    for possibly_dropped in combinations:
-        testbed.dropped = gradebook.dropped.copy()
-        testbed.dropped.loc[:, possibly_dropped] = True
+    for mask in combination_masks:
+        testbed.dropped = gradebook.dropped | mask
         scores.append(testbed.overall_score)
 
     # now we put the scores into a table and find the index of the best
     # score for each student
     all_scores = _pd.concat(scores, axis=1)
-    index_of_best_score = all_scores.idxmax(axis=1)
+    index_of_best_score = all_scores.idxmax(axis=1).to_numpy(dtype=int)
 
-    # loop through the students and mark the assignments which should be
-    # dropped
-    new_dropped = gradebook.dropped.copy()
-    for student in gradebook.students:
-        best_combo_ix = index_of_best_score.loc[student]
-        tossed = list(combinations[best_combo_ix])
-        new_dropped.loc[student, tossed] = True
+    # mark the assignments which should be dropped for every student at once
+    gradebook.dropped = gradebook.dropped | combination_masks[index_of_best_score]
 
-        for assignment in tossed:
+    for student, best_combo_ix in zip(gradebook.students, index_of_best_score):
+        for assignment in combinations[best_combo_ix]:
             gradebook.add_note(student, "drops", f"{assignment.title()} dropped.")
-
-    gradebook.dropped = new_dropped
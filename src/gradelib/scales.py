@@ -17,6 +17,33 @@ def _check_that_scale_monotonically_decreases(scale):
         prev = threshold
 
 
+def _lay_out_scale(scale):
+    """Validate a scale and lay it out in arrays for looking up letter grades.
+
+    Returns the negated thresholds, which increase, along with the letters,
+    followed by an extra F for scores below every threshold.
+
+    """
+    if list(scale) != list(DEFAULT_SCALE):
+        raise ValueError(
+            f"Scale has invalid letter grades. Must be in {set(DEFAULT_SCALE.keys())}"
+        )
+    _check_that_scale_monotonically_decreases(scale)
+
+    negated_thresholds = -_np.fromiter(scale.values(), dtype=float)
+    letters = _np.array(list(scale) + ["F"], dtype=object)
+    return negated_thresholds, letters
+
+
+def _look_up_letter_grades(scores, negated_thresholds, letters):
+    """Look up the letter grade of each score in a scale laid out by _lay_out_scale."""
+    # the thresholds decrease, so the number of thresholds above a score is the
+    # position of the highest letter grade it earns. scores below every threshold
+    # (or missing scores) fall past the end, and earn an F
+    positions = _np.searchsorted(negated_thresholds, -scores.to_numpy(dtype=float))
+    return _pd.Series(letters[positions], index=scores.index, name=scores.name)
+
+
 # common scales ========================================================================
 
 DEFAULT_SCALE = _collections.OrderedDict(
@@ -71,21 +98,7 @@ def map_scores_to_letter_grades(scores, scale=None) -> _pd.Series:
     """
     if scale is None:
         scale = DEFAULT_SCALE
-    else:
-        if list(scale) != list(DEFAULT_SCALE):
-            raise ValueError(
-                f"Scale has invalid letter grades. Must be in {set(DEFAULT_SCALE.keys())}"
-            )
-        _check_that_scale_monotonically_decreases(scale)
-
-    def _map(score):
-        for letter, threshold in scale.items():
-            if score >= threshold:
-                return letter
-        else:
-            return "F"
-
-    return scores.apply(_map)
+    return _look_up_letter_grades(scores, *_lay_out_scale(scale))
 
 
 def find_robust_scale(scores, scale=None, grade_gap=0.005, threshold_gap=0.01):
@@ -1,4 +1,12 @@
 import sys
 import pathlib
 
+import pytest  # pyright: ignore
+
 sys.path.append(str(pathlib.Path(__file__).parent))
+
+
+@pytest.fixture(scope="session")
+def examples_directory():
+    """The directory holding the example grade exports."""
+    return pathlib.Path(__file__).parent / "examples"
@@ -0,0 +1,60 @@
+"""Guards on the cost of collecting the test suite."""
+
+import os
+import pathlib
+import subprocess
+import sys
+import textwrap
+
+import gradelib
+
+TESTS_DIRECTORY = pathlib.Path(__file__).parent
+
+# a plugin which makes every way of reading an example file fail. it is loaded
+# before collection starts, so collection fails if any test module reads one
+FORBID_READS_PLUGIN = """
+import pandas as pd
+
+import gradelib.io.canvas
+import gradelib.io.gradescope
+
+
+def _forbidden(*args, **kwargs):
+    raise AssertionError("An example file was read while collecting tests.")
+
+
+def pytest_configure(config):
+    gradelib.io.gradescope.read = _forbidden
+    gradelib.io.canvas.read = _forbidden
+    pd.read_csv = _forbidden
+"""
+
+
+def test_collecting_the_suite_reads_no_example_files(tmp_path):
+    # the example gradebooks are expensive to build, so they are only built by
+    # fixtures, when a test that uses them actually runs
+    (tmp_path / "forbid_example_reads.py").write_text(
+        textwrap.dedent(FORBID_READS_PLUGIN)
+    )
+    # the collecting process should import the very gradelib this one did
+    gradelib_parent = pathlib.Path(gradelib.__file__).parent.parent
+    pythonpath = [str(tmp_path), str(gradelib_parent), os.environ.get("PYTHONPATH", "")]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, pythonpath))}
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "--collect-only",
+            "-q",
+            "-p",
+            "forbid_example_reads",
+            str(TESTS_DIRECTORY),
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,168 @@
+import os
+import pathlib
+import pickle
+import tempfile
+
+import pandas as pd
+import pytest  # pyright: ignore
+
+import gradelib
+import gradelib.io.gradescope
+import gradelib.io.canvas
+
+GRADELIB_DIRECTORY = pathlib.Path(gradelib.__file__).parent
+
+
+# helper functions ---------------------------------------------------------------------
+
+
+def _cache_key(path):
+    """A key which changes whenever the example file or gradelib itself changes."""
+    sources = [path, *GRADELIB_DIRECTORY.rglob("*.py")]
+    return max(source.stat().st_mtime_ns for source in sources)
+
+
+def _read_cached(config, path, reader):
+    """Read an example file, reusing the parsed result pickled by a previous run.
+
+    The parsed object is stored in pytest's cache directory alongside a key
+    derived from the modification times of the example file and of gradelib's
+    source, so edits to either invalidate the cache. If pytest's cache is
+    disabled, the file is simply parsed.
+
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return reader(path)
+
+    key = _cache_key(path)
+    cache_path = cache.mkdir("gradelib_examples") / f"{path.name}.pkl"
+
+    # the key is pickled ahead of the object, so that a stale object -- which
+    # may not even unpickle against the current source -- is never loaded
+    if cache_path.exists():
+        with cache_path.open("rb") as fileobj:
+            if pickle.load(fileobj) == key:
+                return pickle.load(fileobj)
+
+    obj = reader(path)
+
+    # tests may run in several xdist workers at once, so write to a file of our
+    # own and atomically move it into place; readers never see a partial pickle
+    with tempfile.NamedTemporaryFile(dir=cache_path.parent, delete=False) as fileobj:
+        pickle.dump(key, fileobj, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(obj, fileobj, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(fileobj.name, cache_path)
+    return obj
+
+
+def _copier(obj):
+    """A function returning a fresh deep copy of `obj` each time it is called.
+
+    The object is pickled once up front; each copy is then a single
+    `pickle.loads` of the blob, which is cheaper than rebuilding the gradebook.
+
+    """
+    blob = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(blob)
+
+
+def _unmodified_by_tests(gradebook):
+    """Yield a shared gradebook, then check that the tests left it as it was.
+
+    A test that modifies a shared example would silently change what every later
+    test sees, so the example is compared against a snapshot at teardown.
+
+    """
+    snapshot = gradebook.copy()
+    yield gradebook
+
+    message = (
+        "A test modified the {} of a shared example gradebook; tests that "
+        "modify an example should use a fresh_* fixture."
+    )
+    for table in ["points_earned", "points_possible", "lateness", "dropped"]:
+        assert getattr(gradebook, table).equals(
+            getattr(snapshot, table)
+        ), message.format(table)
+    for attribute in ["notes", "grading_groups", "options"]:
+        assert getattr(gradebook, attribute) == getattr(
+            snapshot, attribute
+        ), message.format(attribute)
+
+
+def _read_roster(path):
+    return pd.read_csv(path, delimiter="\t", index_col="Student ID")
+
+
+# fixtures -----------------------------------------------------------------------------
+
+# the example gradebooks are parsed once per session and shared. tests that only
+# read an example, or that exercise a method which validates its arguments
+# before changing anything, use it directly; tests that modify an example call
+# the corresponding fresh_* fixture to get a private copy
+
+
+@pytest.fixture(scope="session")
+def gradescope_example(pytestconfig, examples_directory):
+    example = _read_cached(
+        pytestconfig, examples_directory / "gradescope.csv", gradelib.io.gradescope.read
+    )
+    yield from _unmodified_by_tests(example)
+
+
+@pytest.fixture(scope="session")
+def canvas_example(pytestconfig, examples_directory):
+    example = _read_cached(
+        pytestconfig, examples_directory / "canvas.csv", gradelib.io.canvas.read
+    )
+    yield from _unmodified_by_tests(example)
+
+
+@pytest.fixture(scope="session")
+def canvas_without_lab_example(canvas_example):
+    # the canvas example has Lab 01, which is also in Gradescope. Let's remove it
+    example = canvas_example.copy()
+    example.remove_assignments(["lab 01"])
+    yield from _unmodified_by_tests(example)
+
+
+@pytest.fixture(scope="session")
+def gradescope_without_labs_example(gradescope_example):
+    # several tests need the gradescope example with its labs removed; it is
+    # derived once here rather than by each of them
+    example = gradescope_example.copy()
+    example.remove_assignments(example.assignments.starting_with("lab"))
+    yield from _unmodified_by_tests(example)
+
+
+@pytest.fixture(scope="session")
+def fresh_gradescope_example(gradescope_example):
+    return _copier(gradescope_example)
+
+
+@pytest.fixture(scope="session")
+def fresh_canvas_without_lab_example(canvas_without_lab_example):
+    return _copier(canvas_without_lab_example)
+
+
+@pytest.fixture(scope="session")
+def roster(pytestconfig, examples_directory):
+    return _read_cached(pytestconfig, examples_directory / "egrades.csv", _read_roster)
+
+
+@pytest.fixture(scope="session")
+def roster_pids(roster):
+    """The PIDs of the students on the example roster."""
+    return roster.index
+
+
+@pytest.fixture(scope="session")
+def combined_example(gradescope_example, canvas_without_lab_example, roster):
+    # combining only reads the gradebooks it is given, so the shared examples are
+    # passed as they are
+    combined = gradelib.combine_gradebooks(
+        [gradescope_example, canvas_without_lab_example],
+        restrict_to_students=roster.index,
+    )
+    yield from _unmodified_by_tests(combined)
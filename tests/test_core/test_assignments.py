@@ -16,6 +16,23 @@ def test_starting_with():
     assert set(actual) == {"homework 01", "homework 02", "homework 03"}
 
 
+def test_starting_with_preserves_order_across_repeated_queries():
+    # given
+    assignments = gradelib.Assignments(
+        ["lab 02", "homework 02", "lab 01", "homework 01", "homework", "home"]
+    )
+
+    # when
+    homeworks = assignments.starting_with("homework")
+    labs = assignments.starting_with("lab")
+    nothing = assignments.starting_with("quiz")
+
+    # then
+    assert list(homeworks) == ["homework 02", "homework 01", "homework"]
+    assert list(labs) == ["lab 02", "lab 01"]
+    assert list(nothing) == []
+
+
 def test_ending_with():
     # given
     assignments = gradelib.Assignments(
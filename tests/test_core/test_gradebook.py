@@ -1,121 +1,189 @@
 """Tests of the Gradebook class."""
 
-import pathlib
+import math
+import pickle
+import sys
+import types
 
 import pytest  # pyright: ignore
 import pandas as pd
 import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
 
 import gradelib
-import gradelib.io.gradescope
-import gradelib.io.canvas
 from gradelib import Student
 
+from util import (
+    assert_gradebook_is_sound,
+    gradebook_from,
+)
+
 # examples setup -----------------------------------------------------------------------
 
-EXAMPLES_DIRECTORY = pathlib.Path(__file__).parent.parent / "examples"
-GRADESCOPE_EXAMPLE = gradelib.io.gradescope.read(EXAMPLES_DIRECTORY / "gradescope.csv")
-CANVAS_EXAMPLE = gradelib.io.canvas.read(EXAMPLES_DIRECTORY / "canvas.csv")
+# the homeworks and labs of hw_lab_gradebook
+HW_LAB_HOMEWORKS = ("hw01", "hw02", "hw03")
+HW_LAB_LABS = ("lab01",)
 
-# the canvas example has Lab 01, which is also in Gradescope. Let's remove it
-CANVAS_WITHOUT_LAB_EXAMPLE = gradelib.Gradebook(
-    points_earned=CANVAS_EXAMPLE.points_earned.drop(columns="lab 01"),
-    points_possible=CANVAS_EXAMPLE.points_possible.drop(index="lab 01"),
-    lateness=CANVAS_EXAMPLE.lateness.drop(columns="lab 01"),
-    dropped=CANVAS_EXAMPLE.dropped.drop(columns="lab 01"),
+# a lenient scale used by the letter grade tests. read-only so no test can alter it
+LOW_SCALE = types.MappingProxyType(
+    {
+        "A+": 0.9,
+        "A": 0.8,
+        "A-": 0.7,
+        "B+": 0.6,
+        "B": 0.5,
+        "B-": 0.4,
+        "C+": 0.35,
+        "C": 0.3,
+        "C-": 0.2,
+        "D": 0.1,
+        "F": 0,
+    }
 )
 
-ROSTER = pd.read_csv(EXAMPLES_DIRECTORY / "egrades.csv", delimiter="\t").set_index(
-    "Student ID"
-)
 
+# fixtures -----------------------------------------------------------------------------
 
-# helper functions ---------------------------------------------------------------------
+
+@pytest.fixture
+def hw_lab_gradebook():
+    """Three homeworks and a lab, for two students."""
+    return gradebook_from(
+        [[10, 30, 20, 25], [20, 40, 30, 10]],
+        [*HW_LAB_HOMEWORKS, *HW_LAB_LABS],
+        [20, 50, 30, 40],
+    )
 
 
-def assert_gradebook_is_sound(gradebook):
-    assert (
-        gradebook.points_earned.shape
-        == gradebook.dropped.shape
-        == gradebook.lateness.shape
+@pytest.fixture
+def hw_lab_lab_gradebook():
+    """Two homeworks and two labs, for two students."""
+    return gradebook_from(
+        [[10, 30, 20, 25], [20, 40, 30, 10]],
+        ["hw01", "hw02", "lab01", "lab02"],
+        [20, 50, 30, 40],
     )
-    assert (gradebook.points_earned.columns == gradebook.dropped.columns).all()
-    assert (gradebook.points_earned.columns == gradebook.lateness.columns).all()
-    assert (gradebook.points_earned.index == gradebook.dropped.index).all()
-    assert (gradebook.points_earned.index == gradebook.lateness.index).all()
-    assert (gradebook.points_earned.columns == gradebook.points_possible.index).all()
-
-
-def as_gradebook_type(gb, gradebook_cls):
-    """Creates a Gradebook object from a Gradebook or Gradebook."""
-    return gradebook_cls(
-        points_earned=gb.points_earned,
-        points_possible=gb.points_possible,
-        lateness=gb.lateness,
-        dropped=gb.dropped,
-        notes=gb.notes,
-        options=gb.options,
+
+
+@pytest.fixture
+def scores_gradebook():
+    """Three homeworks of very different sizes and a lab, for two students."""
+    return gradebook_from(
+        [[1, 30, 90, 20], [2, 7, 15, 20]],
+        ["hw01", "hw02", "hw03", "lab01"],
+        [2, 50, 100, 20],
     )
 
 
+@pytest.fixture
+def parts_gradebook():
+    """A gradebook whose first homework is split in two parts."""
+    return gradebook_from(
+        [[1, 30, 90, 20], [2, 7, 15, 20]],
+        ["hw01", "hw01 - programming", "hw02", "lab01"],
+        [2, 50, 100, 20],
+    )
+
+
+# helper functions ---------------------------------------------------------------------
+
+
+def _assert_close(actual, expected, *, rel_tol=1e-12):
+    """Assert that two floats agree up to rounding, treating NaNs as equal."""
+    assert math.isclose(actual, expected, rel_tol=rel_tol, abs_tol=0) or (
+        math.isnan(actual) and math.isnan(expected)
+    ), f"{actual} != {expected}"
+
+
+def _assert_scores(actual, expected, students, columns=None):
+    """Assert that a series or table of scores has the expected values and labels.
+
+    Compares the underlying arrays rather than building an expected pandas object.
+
+    """
+    assert_allclose(actual.to_numpy(), expected, rtol=1e-12)
+    assert list(actual.index) == list(students)
+    if columns is not None:
+        assert list(actual.columns) == list(columns)
+
+
+# tests: constructors ==================================================================
+
+
+def test_from_arrays_labels_every_table_with_the_given_students_and_assignments():
+    gb = gradelib.Gradebook.from_arrays(
+        [[10, 30], [20, 40]],
+        [20, 50],
+        ["A1", "A2"],
+        ["hw01", "hw02"],
+        lateness=np.array([[0, 60], [0, 0]], dtype="timedelta64[s]"),
+        dropped=[[False, True], [False, False]],
+    )
+
+    assert_gradebook_is_sound(gb)
+    assert list(gb.students) == ["A1", "A2"]
+    assert isinstance(gb.students[0], Student)
+    assert list(gb.assignments) == ["hw01", "hw02"]
+    assert gb.points_earned.loc["A2", "hw01"] == 20
+    assert gb.points_possible["hw02"] == 50
+    assert gb.lateness.loc["A1", "hw02"] == pd.Timedelta(60, unit="s")
+    assert gb.dropped.loc["A1", "hw02"]
+
+
 # tests: options =======================================================================
 
 # lateness fudge -----------------------------------------------------------------------
 
 
 def test_lateness_fudge_defaults_to_5_minutes():
-    columns = ["hw01", "hw02"]
-    p1 = pd.Series(data=[1, 30], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7], index=columns, name="A2")
-    l1 = pd.Series(
-        data=[pd.Timedelta(seconds=30), pd.Timedelta(seconds=0)],
-        index=columns,
-        name="A1",
+    gradebook = gradebook_from(
+        [[1, 30], [2, 7]],
+        ["hw01", "hw02"],
+        [2, 50],
+        lateness=np.array([[30, 0], [30, 60 * 5 + 1]], dtype="timedelta64[s]"),
     )
-    l2 = pd.Series(
-        data=[pd.Timedelta(seconds=30), pd.Timedelta(seconds=60 * 5 + 1)],
-        index=columns,
-        name="A2",
+
+    assert_array_equal(gradebook.late.to_numpy(), [[False, False], [False, True]])
+
+
+def test_lateness_fudge_can_be_changed():
+    gradebook = gradebook_from(
+        [[1, 30], [2, 7]],
+        ["hw01", "hw02"],
+        [2, 50],
+        lateness=np.array([[30, 0], [30, 60 * 5 + 1]], dtype="timedelta64[s]"),
     )
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50], index=columns)
-    lateness = pd.DataFrame([l1, l2])
+    assert_array_equal(gradebook.late.to_numpy(), [[False, False], [False, True]])
 
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness)
+    gradebook.options.lateness_fudge = 10
 
-    assert gradebook.late.loc["A1", "hw01"] == False
-    assert gradebook.late.loc["A2", "hw02"] == True
+    assert_array_equal(gradebook.late.to_numpy(), [[True, False], [True, True]])
 
 
-def test_lateness_fudge_can_be_changed():
-    columns = ["hw01", "hw02"]
-    p1 = pd.Series(data=[1, 30], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7], index=columns, name="A2")
-    l1 = pd.Series(
-        data=[pd.Timedelta(seconds=30), pd.Timedelta(seconds=0)],
-        index=columns,
-        name="A1",
-    )
-    l2 = pd.Series(
-        data=[pd.Timedelta(seconds=30), pd.Timedelta(seconds=60 * 5 + 1)],
-        index=columns,
-        name="A2",
+def test_lateness_fudge_can_be_fractional():
+    gradebook = gradebook_from(
+        [[1, 30], [2, 7]],
+        ["hw01", "hw02"],
+        [2, 50],
+        lateness=np.array([[300, 0], [301, 0]], dtype="timedelta64[s]"),
     )
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50], index=columns)
-    lateness = pd.DataFrame([l1, l2])
+    gradebook.options.lateness_fudge = 300.5
 
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness)
+    assert_array_equal(gradebook.late.to_numpy(), [[False, False], [True, False]])
 
-    assert gradebook.late.loc["A1", "hw01"] == False
-    assert gradebook.late.loc["A2", "hw02"] == True
 
-    gradebook.options.lateness_fudge = 10
+def test_late_treats_missing_lateness_as_on_time():
+    gradebook = gradebook_from(
+        [[1, 30], [2, 7]],
+        ["hw01", "hw02"],
+        [2, 50],
+        lateness=np.array([["NaT", 0], [30, 60 * 6]], dtype="timedelta64[s]"),
+    )
 
-    assert gradebook.late.loc["A1", "hw01"] == True
-    assert gradebook.late.loc["A2", "hw02"] == True
+    assert_array_equal(gradebook.late.to_numpy(), [[False, False], [False, True]])
+    assert gradebook.late.columns.equals(gradebook.points_earned.columns)
 
 
 # tests: properties ====================================================================
@@ -124,126 +192,278 @@ def test_lateness_fudge_can_be_changed():
 # students -----------------------------------------------------------------------------
 
 
-def test_students_attribute_returns_students_objects():
-    columns = ["hw01", "hw02", "lab01", "lab02"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
+def test_students_attribute_returns_students_objects(hw_lab_lab_gradebook):
+    gb = hw_lab_lab_gradebook
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
+    assert isinstance(gb.students, gradelib.Students)
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
 
-    assert isinstance(gb.students, gradelib.Students)
+# points -------------------------------------------------------------------------------
 
 
-# weight -------------------------------------------------------------------------------
+def test_points_are_stored_as_floats_whatever_their_input_dtype():
+    # scores may be missing or fractional, so narrower input dtypes are widened
+    gb = gradebook_from(
+        np.array([[1, 30], [2, 7]], dtype=np.int32),
+        ["hw01", "hw02"],
+        np.array([2, 50], dtype=np.int32),
+    )
 
+    assert (gb.points_earned.dtypes == np.float64).all()
+    assert gb.points_possible.dtype == np.float64
 
-def test_weight_in_group_without_grading_groups_is_nan():
-    columns = ["hw01", "hw02", "lab01", "lab02"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
+@pytest.mark.parametrize(
+    "points_possible, culprit",
+    [
+        (pd.Series([2, 50], index=["hw01", "hw03"]), "hw02"),
+        (pd.Series([2], index=["hw01"]), "hw02"),
+        (pd.Series([2, 50, 10], index=["hw01", "hw02", "hw03"]), "hw03"),
+    ],
+)
+def test_raises_if_points_possible_is_for_other_assignments(points_possible, culprit):
+    points_earned = pd.DataFrame(
+        [[1, 30], [2, 7]], index=["A1", "A2"], columns=["hw01", "hw02"]
+    )
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
+    with pytest.raises(ValueError, match=culprit):
+        gradelib.Gradebook(points_earned, points_possible)
 
-    assert np.isnan(gb.weight_in_group.loc["A1", "hw01"])
-    assert np.isnan(gb.weight_in_group.loc["A1", "hw02"])
-    assert np.isnan(gb.weight_in_group.loc["A2", "hw01"])
-    assert np.isnan(gb.weight_in_group.loc["A2", "hw02"])
 
+def test_weights_raise_if_points_possible_is_replaced_by_one_for_other_assignments(
+    scores_gradebook,
+):
+    gb = scores_gradebook
+    gb.grading_groups = {"homeworks": (["hw01", "hw02"], 0.5), "labs": (["lab01"], 0.5)}
 
-def test_weight_in_group_defaults_to_being_computed_from_points_possible():
-    columns = ["hw01", "hw02", "lab01", "lab02"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
+    # when
+    gb.points_possible = pd.Series([2, 50, 20], index=["hw01", "hw02", "lab01"])
+
+    # then
+    with pytest.raises(ValueError, match="hw03"):
+        gb.weight_in_group
+
+
+def test_assignment_names_are_interned():
+    # names built at runtime, as when read from a file, are distinct objects
+    names = ["".join(["hw", "01"]), "".join(["lab", "01"])]
+    gb = gradebook_from([[1, 2], [3, 4]], names, [5, 5])
+
+    assert gb.points_earned.columns[0] is sys.intern("hw01")
+    assert gb.lateness.columns[1] is sys.intern("lab01")
+
+    gb.add_assignment(
+        "".join(["hw", "02"]),
+        pd.Series([1.0, 2.0], index=gb.students),
+        5,
+    )
+    assert gb.points_earned.columns[2] is sys.intern("hw02")
+
+
+def test_interning_keeps_the_name_of_the_assignment_index():
+    points_earned = pd.DataFrame(
+        [[1, 30], [2, 7]],
+        index=["A1", "A2"],
+        columns=pd.Index(["hw01", "hw02"], name="assignment"),
+    )
+
+    gb = gradelib.Gradebook(points_earned, pd.Series([2, 50], index=["hw01", "hw02"]))
+
+    assert gb.points_earned.columns.name == "assignment"
+
+
+# lateness -----------------------------------------------------------------------------
+
+
+def test_lateness_defaults_to_a_single_array_of_zero_timedeltas(hw_lab_lab_gradebook):
+    gb = hw_lab_lab_gradebook
+
+    lateness = gb.lateness.to_numpy()
+    assert lateness.dtype == "timedelta64[ns]"
+    assert (lateness == np.timedelta64(0)).all()
+    assert lateness.flags.c_contiguous or lateness.flags.f_contiguous
+    assert gb.lateness.columns is gb.points_earned.columns
+
+
+# dropped ------------------------------------------------------------------------------
+
+
+def test_dropped_defaults_to_a_single_boolean_array_of_false(hw_lab_lab_gradebook):
+    gb = hw_lab_lab_gradebook
+
+    dropped = gb.dropped.to_numpy()
+    assert dropped.dtype == bool
+    assert not dropped.any()
+    assert dropped.flags.c_contiguous or dropped.flags.f_contiguous
+
+
+def test_dropped_is_converted_to_booleans():
+    gb = gradebook_from(
+        [[10, 30, 20, 25], [20, 40, 30, 10]],
+        ["hw01", "hw02", "lab01", "lab02"],
+        [20, 50, 30, 40],
+        dropped=[[0, 1, 0, 0], [0, 0, 0, 1]],
+    )
+
+    assert (gb.dropped.dtypes == bool).all()
+    assert gb.dropped.loc["A1", "hw02"]
+    assert not gb.dropped.loc["A1", "hw01"]
+
+
+def test_dropped_is_converted_to_booleans_when_replaced(hw_lab_gradebook):
+    gb = hw_lab_gradebook
+
+    # when
+    gb.dropped = pd.DataFrame(
+        [[0, 1, 0, 0], [0, 0, 0, 1]],
+        index=["A1", "A2"],
+        columns=["hw01", "hw02", "hw03", "lab01"],
+    )
+
+    # then
+    assert gb.dropped.to_numpy().dtype == bool
+    assert gb.dropped.loc["A2", "lab01"]
+    assert gb.dropped.columns is gb.points_earned.columns
+
+
+@pytest.mark.parametrize(
+    "entry", [np.nan, None, 2, "no"], ids=["nan", "none", "two", "string"]
+)
+def test_dropped_raises_if_replaced_by_a_table_that_is_not_boolean(
+    hw_lab_gradebook, entry
+):
+    gb = hw_lab_gradebook
+    replacement = gb.dropped.astype(object)
+    replacement.loc["A1", "hw02"] = entry
+
+    with pytest.raises(TypeError):
+        gb.dropped = replacement
+
+
+def test_mark_dropped_marks_each_pair_and_nothing_else(hw_lab_gradebook):
+    gb = hw_lab_gradebook
+
+    # when
+    gb.mark_dropped([("A1", "hw02"), (Student("A2"), "lab01")])
+
+    # then
+    dropped = gb.dropped
+    assert dropped.at["A1", "hw02"]
+    assert dropped.at["A2", "lab01"]
+    assert dropped.to_numpy().sum() == 2
+    assert dropped.columns is gb.points_earned.columns
+
+
+def test_mark_dropped_raises_on_unknown_student_or_assignment(hw_lab_gradebook):
+    gb = hw_lab_gradebook
+
+    with pytest.raises(KeyError):
+        gb.mark_dropped([("A1", "hw02"), ("A9", "hw01")])
 
-    points_earned = pd.DataFrame([p1, p2])
+    with pytest.raises(KeyError):
+        gb.mark_dropped([("A1", "hw99")])
+
+    assert not gb.dropped.to_numpy().any()
+
+
+def test_tables_share_their_labels_without_modifying_the_inputs():
+    # the constructor itself is under test, so it is handed separate tables
+    columns = ["hw01", "hw02", "lab01", "lab02"]
+    points_earned = pd.DataFrame(
+        [[10, 30, 20, 25], [20, 40, 30, 10]], index=["A1", "A2"], columns=columns
+    )
     points_possible = pd.Series([20, 50, 30, 40], index=columns)
+    dropped = pd.DataFrame(False, index=["A1", "A2"], columns=list(columns))
+    original_columns = dropped.columns
+
+    gb = gradelib.Gradebook(points_earned, points_possible, dropped=dropped)
+
+    assert gb.dropped.columns is gb.points_earned.columns
+    assert gb.dropped.index is gb.points_earned.index
+    assert gb.lateness.columns is gb.points_earned.columns
+    assert gb.points_possible.index is gb.points_earned.columns
+    assert dropped.columns is original_columns
+
+
+# weight -------------------------------------------------------------------------------
+
+
+def test_weight_in_group_without_grading_groups_is_nan(hw_lab_lab_gradebook):
+    gb = hw_lab_lab_gradebook
+
+    assert np.isnan(gb.weight_in_group.to_numpy()).all()
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
+
+def test_weight_in_group_defaults_to_being_computed_from_points_possible(
+    hw_lab_lab_gradebook,
+):
+    gb = hw_lab_lab_gradebook
 
     gb.grading_groups = {
         "homeworks": (gb.assignments.starting_with("hw"), 0.75),
         "labs": (gb.assignments.starting_with("lab"), 0.25),
     }
 
-    assert gb.weight_in_group.loc["A1", "hw01"] == 20 / 70
-    assert gb.weight_in_group.loc["A1", "hw02"] == 50 / 70
-    assert gb.weight_in_group.loc["A2", "hw01"] == 20 / 70
-    assert gb.weight_in_group.loc["A2", "hw02"] == 50 / 70
-
-
-def test_weight_in_group_assignments_not_in_a_group_are_nan():
-    columns = ["hw01", "hw02", "lab01", "lab02"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
+    # each assignment's weight is its share of the group's points possible
+    hw_possible, lab_possible = np.array([20, 50]), np.array([30, 40])
+    expected_row = np.concatenate(
+        [hw_possible / hw_possible.sum(), lab_possible / lab_possible.sum()]
+    )
+    assert_allclose(gb.weight_in_group.to_numpy(), np.tile(expected_row, (2, 1)))
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
+def test_weight_in_group_assignments_not_in_a_group_are_nan(hw_lab_lab_gradebook):
+    gb = hw_lab_lab_gradebook
 
     gb.grading_groups = {
         "homeworks": (gb.assignments.starting_with("hw"), 1),
     }
 
-    assert gb.weight_in_group.loc["A1", "hw01"] == 20 / 70
-    assert gb.weight_in_group.loc["A1", "hw02"] == 50 / 70
-    assert gb.weight_in_group.loc["A2", "hw01"] == 20 / 70
-    assert gb.weight_in_group.loc["A2", "hw02"] == 50 / 70
-    assert np.isnan(gb.weight_in_group.loc["A1", "lab01"])
-    assert np.isnan(gb.weight_in_group.loc["A1", "lab02"])
-    assert np.isnan(gb.weight_in_group.loc["A2", "lab01"])
-    assert np.isnan(gb.weight_in_group.loc["A2", "lab02"])
-
-
-def test_weight_in_group_takes_drops_into_account_by_renormalizing():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
+    expected = np.array(
+        [
+            [20 / 70, 50 / 70, np.nan, np.nan],
+            [20 / 70, 50 / 70, np.nan, np.nan],
+        ]
+    )
+    assert_allclose(
+        gb.weight_in_group.to_numpy(),
+        expected,
+        equal_nan=True,
+    )
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
-    gb.dropped.loc["A1", "hw01"] = True
-    gb.dropped.loc["A2", "hw01"] = True
-    gb.dropped.loc["A2", "hw03"] = True
+@pytest.mark.parametrize(
+    "attribute, group_weight", [("weight_in_group", 1.0), ("overall_weight", 0.75)]
+)
+def test_weights_take_drops_into_account_by_renormalizing(
+    hw_lab_gradebook, attribute, group_weight
+):
+    gb = hw_lab_gradebook
+    gb.mark_dropped([("A1", "hw01"), ("A2", "hw01"), ("A2", "hw03")])
 
     gb.grading_groups = {
-        "homeworks": (gb.assignments.starting_with("hw"), 0.75),
-        "labs": (gb.assignments.starting_with("lab"), 0.25),
+        "homeworks": (HW_LAB_HOMEWORKS, 0.75),
+        "labs": (HW_LAB_LABS, 0.25),
     }
 
     # then
     # - dropped assignments have a weight of zero
-    # - all other assignments have a renormalized weight
-    assert gb.weight_in_group.loc["A1", "hw01"] == 0.0
-    assert gb.weight_in_group.loc["A1", "hw02"] == 50 / 80
-    assert gb.weight_in_group.loc["A2", "hw01"] == 0.0
-    assert gb.weight_in_group.loc["A2", "hw02"] == 1.0
+    # - all other assignments have a renormalized weight, scaled by the
+    #   group's weight when measured against the overall grade
+    weights = getattr(gb, attribute)
+    _assert_close(weights.loc["A1", "hw01"], 0.0 * group_weight)
+    _assert_close(weights.loc["A1", "hw02"], 50 / 80 * group_weight)
+    _assert_close(weights.loc["A2", "hw01"], 0.0 * group_weight)
+    _assert_close(weights.loc["A2", "hw02"], 1.0 * group_weight)
 
 
-def test_weight_in_group_with_all_dropped_in_group_raises():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
-
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
-
-    gb = gradelib.Gradebook(points_earned, points_possible)
-    gb.dropped.loc["A1", "hw01"] = True
-    gb.dropped.loc["A1", "hw02"] = True
-    gb.dropped.loc["A1", "hw03"] = True
+def test_weight_in_group_with_all_dropped_in_group_raises(hw_lab_gradebook):
+    gb = hw_lab_gradebook
+    gb.mark_dropped([("A1", "hw01"), ("A1", "hw02"), ("A1", "hw03")])
 
     gb.grading_groups = {
-        "homeworks": (gb.assignments.starting_with("hw"), 0.75),
-        "labs": (gb.assignments.starting_with("lab"), 0.25),
+        "homeworks": (HW_LAB_HOMEWORKS, 0.75),
+        "labs": (HW_LAB_LABS, 0.25),
     }
 
     # then
@@ -251,71 +471,85 @@ def test_weight_in_group_with_all_dropped_in_group_raises():
         gb.weight_in_group.loc["A1", "hw01"]
 
 
-def test_weight_in_group_with_normalization():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
+def test_weight_in_group_with_all_dropped_names_the_group_and_students(
+    hw_lab_gradebook,
+):
+    gb = hw_lab_gradebook
+    gb.mark_dropped([("A2", "lab01"), ("A2", "hw01")])
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
+    gb.grading_groups = {
+        "homeworks": (HW_LAB_HOMEWORKS, 0.75),
+        "labs": (HW_LAB_LABS, 0.25),
+    }
+
+    # then
+    with pytest.raises(ValueError, match="in group 'labs'") as excinfo:
+        gb.weight_in_group
+
+    assert "A2" in str(excinfo.value) and "A1" not in str(excinfo.value)
+
+
+def test_weight_in_group_raises_if_only_assignments_worth_zero_points_remain():
+    gb = gradebook_from(
+        [[1, 30, 90], [2, 7, 15]], ["hw01", "hw02", "hw03"], [2, 50, 100]
+    )
+    gb.grading_groups = {"homeworks": ({"hw01": 0.5, "hw02": 0.5}, 1)}
+    gb.mark_dropped([("A1", "hw02")])
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
+    # when points possible is replaced by a series in another order
+    gb.points_possible = pd.Series([100, 50, 0], index=["hw03", "hw02", "hw01"])
+
+    # then
+    with pytest.raises(ValueError, match="in group 'homeworks'") as excinfo:
+        gb.weight_in_group
+
+    assert "A1" in str(excinfo.value) and "A2" not in str(excinfo.value)
+
+
+def test_weight_in_group_with_normalization(hw_lab_gradebook):
+    gb = hw_lab_gradebook
 
     gb.grading_groups = {
         "homeworks": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("hw")),
+            gradelib.normalize(HW_LAB_HOMEWORKS),
             0.75,
         ),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.weight_in_group.loc["A1", "hw01"] == 1 / 3
-    assert gb.weight_in_group.loc["A1", "hw02"] == 1 / 3
-    assert gb.weight_in_group.loc["A2", "lab01"] == 1.0
-
+    weight_in_group = gb.weight_in_group
+    _assert_close(weight_in_group.at["A1", "hw01"], 1 / 3)
+    _assert_close(weight_in_group.at["A1", "hw02"], 1 / 3)
+    _assert_close(weight_in_group.at["A2", "lab01"], 1.0)
 
-def test_weight_in_group_with_normalization_and_drops():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
-
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
+def test_weight_in_group_with_normalization_and_drops(hw_lab_gradebook):
+    gb = hw_lab_gradebook
 
-    gb.dropped.loc["A1", "hw02"] = True
-    gb.dropped.loc["A2", "hw01"] = True
-    gb.dropped.loc["A2", "hw03"] = True
+    gb.mark_dropped([("A1", "hw02"), ("A2", "hw01"), ("A2", "hw03")])
 
     gb.grading_groups = {
         "homeworks": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("hw")),
+            gradelib.normalize(HW_LAB_HOMEWORKS),
             0.75,
         ),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.weight_in_group.loc["A1", "hw01"] == 1 / 2
-    assert gb.weight_in_group.loc["A1", "hw02"] == 0.0
-    assert gb.weight_in_group.loc["A2", "hw02"] == 1.0
-
+    weight_in_group = gb.weight_in_group
+    _assert_close(weight_in_group.at["A1", "hw01"], 1 / 2)
+    _assert_close(weight_in_group.at["A1", "hw02"], 0.0)
+    _assert_close(weight_in_group.at["A2", "hw02"], 1.0)
 
-def test_weight_in_group_with_custom_weights():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
-
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
+def test_weight_in_group_with_custom_weights(hw_lab_gradebook):
+    gb = hw_lab_gradebook
 
     gb.grading_groups = {
         "homeworks": gradelib.GradingGroup(
@@ -327,29 +561,21 @@ def test_weight_in_group_with_custom_weights():
             0.75,
         ),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.weight_in_group.loc["A1", "hw01"] == 0.3
-    assert gb.weight_in_group.loc["A1", "hw02"] == 0.5
-    assert gb.weight_in_group.loc["A2", "hw02"] == 0.5
+    weight_in_group = gb.weight_in_group
+    _assert_close(weight_in_group.at["A1", "hw01"], 0.3)
+    _assert_close(weight_in_group.at["A1", "hw02"], 0.5)
+    _assert_close(weight_in_group.at["A2", "hw02"], 0.5)
 
 
-def test_weight_in_group_with_custom_weights_and_drops():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
-
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
-
-    gb = gradelib.Gradebook(points_earned, points_possible)
+def test_weight_in_group_with_custom_weights_and_drops(hw_lab_gradebook):
+    gb = hw_lab_gradebook
 
-    gb.dropped.loc["A1", "hw02"] = True
-    gb.dropped.loc["A2", "hw01"] = True
-    gb.dropped.loc["A2", "hw03"] = True
+    gb.mark_dropped([("A1", "hw02"), ("A2", "hw01"), ("A2", "hw03")])
 
     gb.grading_groups = {
         "homeworks": gradelib.GradingGroup(
@@ -361,154 +587,176 @@ def test_weight_in_group_with_custom_weights_and_drops():
             0.75,
         ),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.weight_in_group.loc["A1", "hw01"] == 0.3 / 0.5
-    assert gb.weight_in_group.loc["A1", "hw02"] == 0.0
-    assert gb.weight_in_group.loc["A1", "hw03"] == 0.2 / 0.5
-    assert gb.weight_in_group.loc["A2", "hw02"] == 1.0
+    weight_in_group = gb.weight_in_group
+    _assert_close(weight_in_group.at["A1", "hw01"], 0.3 / 0.5)
+    _assert_close(weight_in_group.at["A1", "hw02"], 0.0)
+    _assert_close(weight_in_group.at["A1", "hw03"], 0.2 / 0.5)
+    _assert_close(weight_in_group.at["A2", "hw02"], 1.0)
 
 
-# overall_weight -----------------------------------------------------------------------
-
+def test_weight_in_group_reflects_drops_made_in_place_after_being_read(
+    hw_lab_gradebook,
+):
+    gb = hw_lab_gradebook
+    gb.grading_groups = {
+        "homeworks": (HW_LAB_HOMEWORKS, 0.75),
+        "labs": (HW_LAB_LABS, 0.25),
+    }
+    _assert_close(gb.weight_in_group.loc["A1", "hw02"], 50 / 100)
 
-def test_overall_weight_defaults_to_being_computed_from_points_possible():
-    columns = ["hw01", "hw02", "lab01", "lab02"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
+    # when
+    gb.dropped.loc["A1", "hw01"] = True
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
+    # then
+    _assert_close(gb.weight_in_group.loc["A1", "hw02"], 50 / 80)
+    _assert_close(gb.value.loc["A1", "hw02"], 30 / 50 * 50 / 80 * 0.75)
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
 
+def test_value_reflects_points_possible_changed_in_place_after_being_read(
+    hw_lab_gradebook,
+):
+    gb = hw_lab_gradebook
     gb.grading_groups = {
-        "homeworks": (gb.assignments.starting_with("hw"), 0.75),
-        "labs": (gb.assignments.starting_with("lab"), 0.25),
+        "homeworks": (HW_LAB_HOMEWORKS, 0.75),
+        "labs": (HW_LAB_LABS, 0.25),
     }
+    _assert_close(gb.value.loc["A1", "hw02"], 30 / 50 * 50 / 100 * 0.75)
 
-    assert gb.overall_weight.loc["A1", "hw01"] == 20 / 70 * 0.75
-    assert gb.overall_weight.loc["A1", "hw02"] == 50 / 70 * 0.75
-    assert gb.overall_weight.loc["A2", "hw01"] == 20 / 70 * 0.75
-    assert gb.overall_weight.loc["A2", "hw02"] == 50 / 70 * 0.75
+    # when
+    gb.points_possible["hw02"] = 60
 
+    # then
+    _assert_close(gb.value.loc["A1", "hw02"], 30 / 60 * 50 / 100 * 0.75)
 
-def test_overall_weight_assignments_not_in_a_group_are_nan():
-    columns = ["hw01", "hw02", "lab01", "lab02"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
+def test_weight_in_group_reflects_new_grading_groups_after_being_read(hw_lab_gradebook):
+    gb = hw_lab_gradebook
+    gb.grading_groups = {
+        "homeworks": (HW_LAB_HOMEWORKS, 0.75),
+        "labs": (HW_LAB_LABS, 0.25),
+    }
+    _assert_close(gb.weight_in_group.loc["A1", "hw02"], 50 / 100)
+
+    # when
+    gb.grading_groups = {
+        "homeworks": (gradelib.normalize(HW_LAB_HOMEWORKS), 0.75),
+        "labs": (HW_LAB_LABS, 0.25),
+    }
+
+    # then
+    _assert_close(gb.weight_in_group.loc["A1", "hw02"], 1 / 3)
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
 
+def test_weight_in_group_is_not_affected_by_modifying_a_previous_result(
+    hw_lab_gradebook,
+):
+    gb = hw_lab_gradebook
     gb.grading_groups = {
-        "homeworks": (gb.assignments.starting_with("hw"), 1),
+        "homeworks": (HW_LAB_HOMEWORKS, 0.75),
+        "labs": (HW_LAB_LABS, 0.25),
     }
 
-    assert gb.overall_weight.loc["A1", "hw01"] == 20 / 70 * 1
-    assert gb.overall_weight.loc["A1", "hw02"] == 50 / 70 * 1
-    assert gb.overall_weight.loc["A2", "hw01"] == 20 / 70 * 1
-    assert gb.overall_weight.loc["A2", "hw02"] == 50 / 70 * 1
-    assert np.isnan(gb.overall_weight.loc["A1", "lab01"])
-    assert np.isnan(gb.overall_weight.loc["A1", "lab02"])
-    assert np.isnan(gb.overall_weight.loc["A2", "lab01"])
-    assert np.isnan(gb.overall_weight.loc["A2", "lab02"])
+    # when
+    weights = gb.weight_in_group
+    weights.loc["A1", "hw02"] = 100
 
+    # then
+    _assert_close(gb.weight_in_group.loc["A1", "hw02"], 50 / 100)
 
-def test_overall_weight_takes_drops_into_account():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
+# overall_weight -----------------------------------------------------------------------
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
-    gb.dropped.loc["A1", "hw01"] = True
-    gb.dropped.loc["A2", "hw01"] = True
-    gb.dropped.loc["A2", "hw03"] = True
+
+def test_overall_weight_defaults_to_being_computed_from_points_possible(
+    hw_lab_lab_gradebook,
+):
+    gb = hw_lab_lab_gradebook
 
     gb.grading_groups = {
         "homeworks": (gb.assignments.starting_with("hw"), 0.75),
         "labs": (gb.assignments.starting_with("lab"), 0.25),
     }
 
-    assert gb.overall_weight.loc["A1", "hw01"] == 0.0 * 0.75
-    assert gb.overall_weight.loc["A1", "hw02"] == 50 / 80 * 0.75
-    assert gb.overall_weight.loc["A2", "hw01"] == 0.0 * 0.75
-    assert gb.overall_weight.loc["A2", "hw02"] == 1.0 * 0.75
+    # each assignment's share of the group's points possible, times the group weight
+    hw_possible, lab_possible = np.array([20, 50]), np.array([30, 40])
+    expected_row = np.concatenate(
+        [
+            hw_possible / hw_possible.sum() * 0.75,
+            lab_possible / lab_possible.sum() * 0.25,
+        ]
+    )
+    assert_allclose(gb.overall_weight.to_numpy(), np.tile(expected_row, (2, 1)))
 
 
-def test_overall_weight_with_normalization():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
+def test_overall_weight_assignments_not_in_a_group_are_nan(hw_lab_lab_gradebook):
+    gb = hw_lab_lab_gradebook
+
+    gb.grading_groups = {
+        "homeworks": (gb.assignments.starting_with("hw"), 1),
+    }
+
+    expected = np.array(
+        [
+            [20 / 70 * 1, 50 / 70 * 1, np.nan, np.nan],
+            [20 / 70 * 1, 50 / 70 * 1, np.nan, np.nan],
+        ]
+    )
+    assert_allclose(
+        gb.overall_weight.to_numpy(),
+        expected,
+        equal_nan=True,
+    )
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
+def test_overall_weight_with_normalization(hw_lab_gradebook):
+    gb = hw_lab_gradebook
 
     gb.grading_groups = {
         "homeworks": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("hw")),
+            gradelib.normalize(HW_LAB_HOMEWORKS),
             0.75,
         ),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.overall_weight.loc["A1", "hw01"] == 1 / 3 * 0.75
-    assert gb.overall_weight.loc["A1", "hw02"] == 1 / 3 * 0.75
-    assert gb.overall_weight.loc["A2", "lab01"] == 1.0 * 0.25
+    overall_weight = gb.overall_weight
+    _assert_close(overall_weight.at["A1", "hw01"], 1 / 3 * 0.75)
+    _assert_close(overall_weight.at["A1", "hw02"], 1 / 3 * 0.75)
+    _assert_close(overall_weight.at["A2", "lab01"], 1.0 * 0.25)
 
 
-def test_overall_weight_with_normalization_and_drops():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
+def test_overall_weight_with_normalization_and_drops(hw_lab_gradebook):
+    gb = hw_lab_gradebook
 
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
-
-    gb = gradelib.Gradebook(points_earned, points_possible)
-
-    gb.dropped.loc["A1", "hw02"] = True
-    gb.dropped.loc["A2", "hw01"] = True
-    gb.dropped.loc["A2", "hw03"] = True
+    gb.mark_dropped([("A1", "hw02"), ("A2", "hw01"), ("A2", "hw03")])
 
     gb.grading_groups = {
         "homeworks": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("hw")),
+            gradelib.normalize(HW_LAB_HOMEWORKS),
             0.75,
         ),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.overall_weight.loc["A1", "hw01"] == 1 / 2 * 0.75
-    assert gb.overall_weight.loc["A1", "hw02"] == 0.0 * 0.75
-    assert gb.overall_weight.loc["A2", "hw02"] == 1.0 * 0.75
-
+    overall_weight = gb.overall_weight
+    _assert_close(overall_weight.at["A1", "hw01"], 1 / 2 * 0.75)
+    _assert_close(overall_weight.at["A1", "hw02"], 0.0 * 0.75)
+    _assert_close(overall_weight.at["A2", "hw02"], 1.0 * 0.75)
 
-def test_overall_weight_with_custom_weights():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
-
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
 
-    gb = gradelib.Gradebook(points_earned, points_possible)
+def test_overall_weight_with_custom_weights(hw_lab_gradebook):
+    gb = hw_lab_gradebook
 
     gb.grading_groups = {
         "homeworks": gradelib.GradingGroup(
@@ -520,29 +768,21 @@ def test_overall_weight_with_custom_weights():
             0.75,
         ),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.overall_weight.loc["A1", "hw01"] == 0.3 * 0.75
-    assert gb.overall_weight.loc["A1", "hw02"] == 0.5 * 0.75
-    assert gb.overall_weight.loc["A2", "hw02"] == 0.5 * 0.75
+    overall_weight = gb.overall_weight
+    _assert_close(overall_weight.at["A1", "hw01"], 0.3 * 0.75)
+    _assert_close(overall_weight.at["A1", "hw02"], 0.5 * 0.75)
+    _assert_close(overall_weight.at["A2", "hw02"], 0.5 * 0.75)
 
 
-def test_overall_weight_with_custom_weights_and_drops():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
-
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
-
-    gb = gradelib.Gradebook(points_earned, points_possible)
+def test_overall_weight_with_custom_weights_and_drops(hw_lab_gradebook):
+    gb = hw_lab_gradebook
 
-    gb.dropped.loc["A1", "hw02"] = True
-    gb.dropped.loc["A2", "hw01"] = True
-    gb.dropped.loc["A2", "hw03"] = True
+    gb.mark_dropped([("A1", "hw02"), ("A2", "hw01"), ("A2", "hw03")])
 
     gb.grading_groups = {
         "homeworks": gradelib.GradingGroup(
@@ -554,78 +794,58 @@ def test_overall_weight_with_custom_weights_and_drops():
             0.75,
         ),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.overall_weight.loc["A1", "hw01"] == 0.3 / 0.5 * 0.75
-    assert gb.overall_weight.loc["A1", "hw02"] == 0.0 * 0.75
-    assert gb.overall_weight.loc["A1", "hw03"] == 0.2 / 0.5 * 0.75
-    assert gb.overall_weight.loc["A2", "hw02"] == 1.0 * 0.75
+    overall_weight = gb.overall_weight
+    _assert_close(overall_weight.at["A1", "hw01"], 0.3 / 0.5 * 0.75)
+    _assert_close(overall_weight.at["A1", "hw02"], 0.0 * 0.75)
+    _assert_close(overall_weight.at["A1", "hw03"], 0.2 / 0.5 * 0.75)
+    _assert_close(overall_weight.at["A2", "hw02"], 1.0 * 0.75)
 
 
 # value --------------------------------------------------------------------------------
 
 
-def test_value_with_default_weights():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
-
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
-
-    gb = gradelib.Gradebook(points_earned, points_possible)
+def test_value_with_default_weights(hw_lab_gradebook):
+    gb = hw_lab_gradebook
 
     gb.grading_groups = {
-        "homeworks": (gb.assignments.starting_with("hw"), 0.75),
+        "homeworks": (HW_LAB_HOMEWORKS, 0.75),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.value.loc["A1", "hw01"] == 10 / 20 * 20 / 100 * 0.75
-    assert gb.value.loc["A1", "hw02"] == 30 / 50 * 50 / 100 * 0.75
-    assert gb.value.loc["A1", "lab01"] == 25 / 40 * 0.25
+    value = gb.value
+    _assert_close(value.at["A1", "hw01"], 10 / 20 * 20 / 100 * 0.75)
+    _assert_close(value.at["A1", "hw02"], 30 / 50 * 50 / 100 * 0.75)
+    _assert_close(value.at["A1", "lab01"], 25 / 40 * 0.25)
 
 
-def test_value_with_drops():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
-
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
-
-    gb = gradelib.Gradebook(points_earned, points_possible)
-    gb.dropped.loc["A1", "hw02"] = True
-    gb.dropped.loc["A2", "hw01"] = True
-    gb.dropped.loc["A2", "hw03"] = True
+def test_value_with_drops(hw_lab_gradebook):
+    gb = hw_lab_gradebook
+    gb.mark_dropped([("A1", "hw02"), ("A2", "hw01"), ("A2", "hw03")])
 
     gb.grading_groups = {
-        "homeworks": (gb.assignments.starting_with("hw"), 0.75),
+        "homeworks": (HW_LAB_HOMEWORKS, 0.75),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.value.loc["A1", "hw01"] == 10 / 20 * 20 / 50 * 0.75
-    assert gb.value.loc["A1", "hw02"] == 0.0
-    assert gb.value.loc["A1", "lab01"] == 25 / 40 * 0.25
+    value = gb.value
+    _assert_close(value.at["A1", "hw01"], 10 / 20 * 20 / 50 * 0.75)
+    _assert_close(value.at["A1", "hw02"], 0.0)
+    _assert_close(value.at["A1", "lab01"], 25 / 40 * 0.25)
 
 
-def test_value_with_custom_assignment_weights():
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[10, 30, 20, 25], index=columns, name="A1")
-    p2 = pd.Series(data=[20, 40, 30, 10], index=columns, name="A2")
-
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([20, 50, 30, 40], index=columns)
-
-    gb = gradelib.Gradebook(points_earned, points_possible)
+def test_value_with_custom_assignment_weights(hw_lab_gradebook):
+    gb = hw_lab_gradebook
 
     gb.grading_groups = {
         "homeworks": gradelib.GradingGroup(
@@ -637,27 +857,24 @@ def test_value_with_custom_assignment_weights():
             0.75,
         ),
         "labs": gradelib.GradingGroup(
-            gradelib.normalize(gb.assignments.starting_with("lab")),
+            gradelib.normalize(HW_LAB_LABS),
             0.25,
         ),
     }
 
-    assert gb.value.loc["A1", "hw01"] == 10 / 20 * 0.3 * 0.75
-    assert gb.value.loc["A1", "hw02"] == 30 / 50 * 0.5 * 0.75
-    assert gb.value.loc["A1", "lab01"] == 25 / 40 * 0.25
+    value = gb.value
+    _assert_close(value.at["A1", "hw01"], 10 / 20 * 0.3 * 0.75)
+    _assert_close(value.at["A1", "hw02"], 30 / 50 * 0.5 * 0.75)
+    _assert_close(value.at["A1", "lab01"], 25 / 40 * 0.25)
 
 
 # overall_score ------------------------------------------------------------------------
 
 
-def test_overall_score_respects_group_weighting():
+def test_overall_score_respects_group_weighting(scores_gradebook):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = scores_gradebook
+    students = gradebook.students
 
     HOMEWORKS = gradebook.assignments.starting_with("hw")
 
@@ -667,38 +884,53 @@ def test_overall_score_respects_group_weighting():
     }
 
     # then
-    pd.testing.assert_series_equal(
+    _assert_scores(
         gradebook.overall_score,
-        pd.Series(
-            [121 / 152 * 0.6 + 20 / 20 * 0.4, 24 / 152 * 0.6 + 20 / 20 * 0.4],
-            index=gradebook.students,
-        ),
+        [121 / 152 * 0.6 + 20 / 20 * 0.4, 24 / 152 * 0.6 + 20 / 20 * 0.4],
+        students,
     )
 
 
-def test_overall_score_raises_if_groups_not_set():
+def test_overall_score_matches_points_possible_to_assignments_by_label():
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
+    points_earned = pd.DataFrame(
+        [[1, 30], [2, 7]], index=["A1", "A2"], columns=["hw01", "hw02"]
+    )
+    points_possible = pd.Series([50, 2], index=["hw02", "hw01"])
     gradebook = gradelib.Gradebook(points_earned, points_possible)
 
+    # when
+    gradebook.grading_groups = {"hw01": 0.5, "hw02": 0.5}
+
+    # then
+    assert_allclose(
+        gradebook.overall_score.to_numpy(),
+        [1 / 2 * 0.5 + 30 / 50 * 0.5, 2 / 2 * 0.5 + 7 / 50 * 0.5],
+    )
+
+    # and when points possible is replaced by a series in yet another order
+    gradebook.points_possible = pd.Series([4, 50], index=["hw01", "hw02"])
+
+    # then
+    assert_allclose(
+        gradebook.overall_score.to_numpy(),
+        [1 / 4 * 0.5 + 30 / 50 * 0.5, 2 / 4 * 0.5 + 7 / 50 * 0.5],
+    )
+
+
+def test_overall_score_raises_if_groups_not_set(scores_gradebook):
+    # given
+    gradebook = scores_gradebook
+
     with pytest.raises(ValueError):
         gradebook.overall_score
 
 
-def test_overall_score_respects_dropped_assignments():
+def test_overall_score_respects_dropped_assignments(scores_gradebook):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
-    gradebook.dropped.loc["A1", "hw02"] = True
-    gradebook.dropped.loc["A2", "hw03"] = True
+    gradebook = scores_gradebook
+    students = gradebook.students
+    gradebook.mark_dropped([("A1", "hw02"), ("A2", "hw03")])
 
     HOMEWORKS = gradebook.assignments.starting_with("hw")
 
@@ -708,42 +940,39 @@ def test_overall_score_respects_dropped_assignments():
     }
 
     # then
-    pd.testing.assert_series_equal(
+    _assert_scores(
         gradebook.overall_score,
-        pd.Series(
-            [91 / 102 * 0.6 + 20 / 20 * 0.4, 9 / 52 * 0.6 + 20 / 20 * 0.40],
-            index=gradebook.students,
-        ),
+        [91 / 102 * 0.6 + 20 / 20 * 0.4, 9 / 52 * 0.6 + 20 / 20 * 0.40],
+        students,
     )
 
 
+def test_overall_score_reflects_grading_groups_edited_in_place_after_being_read():
+    # given
+    gradebook = gradelib.Gradebook.from_arrays(
+        [[3, 4], [4, 4]], [4, 4], students=["A1", "A2"], assignments=["hw", "x"]
+    )
+    gradebook.grading_groups = {"hw": (["hw"], 0.5), "x": (["x"], 0.5)}
+    assert_allclose(gradebook.overall_score.to_numpy(), [0.875, 1.0])
+
+    # when
+    gradebook.grading_groups["hw"].group_weight = 0.25
+    gradebook.grading_groups["x"].group_weight = 0.75
+
+    # then
+    assert_allclose(gradebook.overall_score.to_numpy(), [0.9375, 1.0])
+
+
 # letter_grades ------------------------------------------------------------------------
 
 
-def test_letter_grades_respects_scale():
+def test_letter_grades_respects_scale(scores_gradebook):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
-    gradebook.dropped.loc["A1", "hw02"] = True
-    gradebook.dropped.loc["A2", "hw03"] = True
+    gradebook = scores_gradebook
+    students = gradebook.students
+    gradebook.mark_dropped([("A1", "hw02"), ("A2", "hw03")])
 
-    gradebook.scale = {
-        "A+": 0.9,
-        "A": 0.8,
-        "A-": 0.7,
-        "B+": 0.6,
-        "B": 0.5,
-        "B-": 0.4,
-        "C+": 0.35,
-        "C": 0.3,
-        "C-": 0.2,
-        "D": 0.1,
-        "F": 0,
-    }
+    gradebook.scale = LOW_SCALE
 
     HOMEWORKS = gradebook.assignments.starting_with("hw")
 
@@ -754,35 +983,38 @@ def test_letter_grades_respects_scale():
 
     # then
     # .805 and .742
-    pd.testing.assert_series_equal(
-        gradebook.letter_grades, pd.Series(["A", "A-"], index=gradebook.students)
-    )
+    letter_grades = gradebook.letter_grades
+    assert_array_equal(letter_grades.to_numpy(), ["A", "A-"])
+    assert list(letter_grades.index) == list(students)
 
 
-def test_letter_grades_raises_if_groups_not_set():
+def test_letter_grades_follow_a_scale_edited_in_place(scores_gradebook):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
-    gradebook.dropped.loc["A1", "hw02"] = True
-    gradebook.dropped.loc["A2", "hw03"] = True
-
-    gradebook.scale = {
-        "A+": 0.9,
-        "A": 0.8,
-        "A-": 0.7,
-        "B+": 0.6,
-        "B": 0.5,
-        "B-": 0.4,
-        "C+": 0.35,
-        "C": 0.3,
-        "C-": 0.2,
-        "D": 0.1,
-        "F": 0,
+    gradebook = scores_gradebook
+    gradebook.mark_dropped([("A1", "hw02"), ("A2", "hw03")])
+    gradebook.scale = dict(LOW_SCALE)
+    gradebook.grading_groups = {
+        "homeworks": gradelib.GradingGroup(
+            gradelib.normalize(gradebook.assignments.starting_with("hw")), 0.6
+        ),
+        "labs": (["lab01"], 0.4),
     }
+    assert gradebook.letter_grades.iloc[1] == "A-"
+
+    # when
+    gradebook.scale["A-"] = 0.75
+
+    # then
+    # .742 no longer clears the A- threshold
+    assert gradebook.letter_grades.iloc[1] == "B+"
+
+
+def test_letter_grades_raises_if_groups_not_set(scores_gradebook):
+    # given
+    gradebook = scores_gradebook
+    gradebook.mark_dropped([("A1", "hw02"), ("A2", "hw03")])
+
+    gradebook.scale = LOW_SCALE
 
     with pytest.raises(ValueError):
         gradebook.letter_grades
@@ -794,14 +1026,9 @@ def test_letter_grades_raises_if_groups_not_set():
 # groups -------------------------------------------------------------------------------
 
 
-def test_groups_setter_allows_three_tuple_form():
+def test_groups_setter_allows_three_tuple_form(scores_gradebook):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = scores_gradebook
 
     gradebook.grading_groups = {
         "homeworks": (["hw01", "hw02", "hw03"], 0.5),
@@ -817,15 +1044,38 @@ def test_groups_setter_allows_three_tuple_form():
     }
 
 
-def test_groups_setter_allows_two_tuple_form():
+def test_groups_setter_weights_by_the_points_possible_of_each_assignment_by_label():
     # given
-    columns = ["hw01", "hw02", "hw03", "midterm"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
+    points_earned = pd.DataFrame(
+        [[1, 30], [2, 7]], index=["A1", "A2"], columns=["hw01", "hw02"]
+    )
+    points_possible = pd.Series([50, 2], index=["hw02", "hw01"])
     gradebook = gradelib.Gradebook(points_earned, points_possible)
 
+    # when
+    gradebook.grading_groups = {"homeworks": (["hw01", "hw02"], 1)}
+
+    # then
+    weights = gradebook.grading_groups["homeworks"].assignment_weights
+    assert weights == pytest.approx({"hw01": 2 / 52, "hw02": 50 / 52})
+
+    # and when points possible is replaced by a series in yet another order
+    gradebook.points_possible = pd.Series([48, 2], index=["hw02", "hw01"])
+    gradebook.grading_groups = {"homeworks": (["hw01", "hw02"], 1)}
+
+    # then
+    weights = gradebook.grading_groups["homeworks"].assignment_weights
+    assert weights == pytest.approx({"hw01": 2 / 50, "hw02": 48 / 50})
+
+
+def test_groups_setter_allows_two_tuple_form():
+    # given
+    gradebook = gradebook_from(
+        [[1, 30, 90, 20], [2, 7, 15, 20]],
+        ["hw01", "hw02", "hw03", "midterm"],
+        [2, 50, 100, 20],
+    )
+
     gradebook.grading_groups = {
         "homeworks": (["hw01", "hw02", "hw03"], 0.5),
         "midterm": (0.5),
@@ -839,14 +1089,11 @@ def test_groups_setter_allows_two_tuple_form():
     }
 
 
-def test_groups_setter_raises_by_default_if_group_weights_do_not_sum_to_one():
+def test_groups_setter_raises_by_default_if_group_weights_do_not_sum_to_one(
+    scores_gradebook,
+):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = scores_gradebook
 
     HOMEWORKS = gradebook.assignments.starting_with("hw")
     LABS = gradebook.assignments.starting_with("lab")
@@ -860,12 +1107,11 @@ def test_groups_setter_raises_by_default_if_group_weights_do_not_sum_to_one():
 
 def test_groups_setter_allows_extra_credit_if_option_set():
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01", "ec"]
-    p1 = pd.Series(data=[2, 50, 100, 20, 3], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20, 2], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20, 4], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = gradebook_from(
+        [[2, 50, 100, 20, 3], [2, 7, 15, 20, 2]],
+        ["hw01", "hw02", "hw03", "lab01", "ec"],
+        [2, 50, 100, 20, 4],
+    )
 
     gradebook.options.allow_extra_credit = True
 
@@ -879,17 +1125,12 @@ def test_groups_setter_allows_extra_credit_if_option_set():
     }
 
     # then
-    assert gradebook.overall_score.loc["A1"] == 1.075
+    _assert_close(gradebook.overall_score.loc["A1"], 1.075)
 
 
-def test_groups_setter_raises_if_group_is_empty():
+def test_groups_setter_raises_if_group_is_empty(scores_gradebook):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = scores_gradebook
 
     with pytest.raises(ValueError) as exc:
         gradebook.grading_groups = {
@@ -903,15 +1144,12 @@ def test_groups_setter_raises_if_group_is_empty():
 # group_scores -------------------------------------------------------------------------
 
 
-def test_group_scores_raises_if_all_assignments_in_a_group_are_dropped():
+def test_group_scores_raises_if_all_assignments_in_a_group_are_dropped(
+    scores_gradebook,
+):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
-    gradebook.dropped.loc["A1", "lab01"] = True
+    gradebook = scores_gradebook
+    gradebook.mark_dropped([("A1", "lab01")])
 
     HOMEWORKS = gradebook.assignments.starting_with("hw")
 
@@ -927,11 +1165,11 @@ def test_group_scores_raises_if_all_assignments_in_a_group_are_dropped():
 
 def test_group_scores_treats_nans_as_zeros():
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[np.nan, 30, 90, np.nan], index=columns, name="A1")
-    points_earned = pd.DataFrame([p1])
-    points_possible = pd.Series([100, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = gradebook_from(
+        [[np.nan, 30, 90, np.nan]],
+        ["hw01", "hw02", "hw03", "lab01"],
+        [100, 50, 100, 20],
+    )
 
     HOMEWORKS = gradebook.assignments.starting_with("hw")
 
@@ -941,20 +1179,14 @@ def test_group_scores_treats_nans_as_zeros():
     }
 
     # then
-    assert np.isclose(gradebook.grading_group_scores.loc["A1", "homeworks"], 120 / 250)
-    assert np.isclose(gradebook.grading_group_scores.loc["A1", "labs"], 0)
+    _assert_scores(gradebook.grading_group_scores, [[120 / 250, 0]], ["A1"])
 
 
-def test_group_scores_respects_dropped_assignments():
+def test_group_scores_respects_dropped_assignments(scores_gradebook):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
-    gradebook.dropped.loc["A1", "hw02"] = True
-    gradebook.dropped.loc["A2", "hw03"] = True
+    gradebook = scores_gradebook
+    students = gradebook.students
+    gradebook.mark_dropped([("A1", "hw02"), ("A2", "hw03")])
 
     HOMEWORKS = gradebook.assignments.starting_with("hw")
 
@@ -964,24 +1196,21 @@ def test_group_scores_respects_dropped_assignments():
     }
 
     # then
-    pd.testing.assert_frame_equal(
+    _assert_scores(
         gradebook.grading_group_scores,
-        pd.DataFrame(
-            [[91 / 102, 20 / 20], [9 / 52, 20 / 20]],
-            index=list(gradebook.students),
-            columns=["homeworks", "labs"],
-        ),
+        [[91 / 102, 20 / 20], [9 / 52, 20 / 20]],
+        students,
+        ["homeworks", "labs"],
     )
 
 
 def test_group_scores_with_assignment_weights():
     # given
     columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[0, 15, 30, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[0, 0, 0, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([30, 30, 30, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = gradebook_from(
+        [[0, 15, 30, 20], [0, 0, 0, 20]], columns, [30, 30, 30, 20]
+    )
+    students = gradebook.students
 
     homework_weights = {"hw01": 0.5, "hw02": 0.25, "hw03": 0.25}
 
@@ -991,24 +1220,39 @@ def test_group_scores_with_assignment_weights():
     }
 
     # then
-    pd.testing.assert_frame_equal(
+    _assert_scores(
         gradebook.grading_group_scores,
-        pd.DataFrame(
-            [[0.125 + 0.25, 1], [0, 20 / 20]],
-            index=list(gradebook.students),
-            columns=["homeworks", "labs"],
-        ),
+        [[0.125 + 0.25, 1], [0, 20 / 20]],
+        students,
+        ["homeworks", "labs"],
     )
 
 
+def test_group_scores_of_a_group_with_zero_weight_are_still_computed():
+    # given
+    gradebook = gradebook_from(
+        [[10, 30, 20], [20, 40, 10]], ["hw01", "hw02", "lab01"], [20, 50, 40]
+    )
+
+    gradebook.grading_groups = {
+        "homeworks": (["hw01", "hw02"], 1),
+        "labs": (["lab01"], 0),
+    }
+
+    # then
+    scores = gradebook.grading_group_scores
+    assert_allclose(scores["labs"].to_numpy(), [20 / 40, 10 / 40])
+    assert_allclose(scores["homeworks"].to_numpy(), [40 / 70, 60 / 70])
+
+
 # tests: add/remove assignments ========================================================
 
 # restrict_to_assignments --------------------------------------------------------------
 
 
-def test_restrict_to_assignments():
+def test_restrict_to_assignments(fresh_gradescope_example):
     # when
-    example = GRADESCOPE_EXAMPLE.copy()
+    example = fresh_gradescope_example()
     example.restrict_to_assignments(["homework 01", "homework 02"])
 
     # then
@@ -1016,9 +1260,11 @@ def test_restrict_to_assignments():
     assert_gradebook_is_sound(example)
 
 
-def test_restrict_to_assignments_raises_if_assignment_does_not_exist():
+def test_restrict_to_assignments_raises_if_assignment_does_not_exist(
+    gradescope_example,
+):
     # given
-    example = GRADESCOPE_EXAMPLE.copy()
+    example = gradescope_example
     assignments = ["homework 01", "this aint an assignment"]
 
     # then
@@ -1028,12 +1274,11 @@ def test_restrict_to_assignments_raises_if_assignment_does_not_exist():
 
 def test_restrict_to_assignments_resets_groups():
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01", "midterm"]
-    p1 = pd.Series(data=[1, 30, 90, 20, 30], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20, 30], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20, 30], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = gradebook_from(
+        [[1, 30, 90, 20, 30], [2, 7, 15, 20, 30]],
+        ["hw01", "hw02", "hw03", "lab01", "midterm"],
+        [2, 50, 100, 20, 30],
+    )
 
     gradebook.grading_groups = {
         "homeworks": ({"hw01": 0.25, "hw02": 0.5, "hw03": 0.25}, 0.5),
@@ -1051,10 +1296,9 @@ def test_restrict_to_assignments_resets_groups():
 # remove_assignments -------------------------------------------------------------------
 
 
-def test_remove_assignments():
-    # when
-    example = GRADESCOPE_EXAMPLE.copy()
-    example.remove_assignments(example.assignments.starting_with("lab"))
+def test_remove_assignments(gradescope_without_labs_example):
+    # given
+    example = gradescope_without_labs_example
 
     # then
     assert set(example.assignments) == {
@@ -1071,9 +1315,23 @@ def test_remove_assignments():
     assert_gradebook_is_sound(example)
 
 
-def test_remove_assignments_resets_groups():
+def test_remove_assignments_preserves_order_of_remaining_assignments(
+    gradescope_example,
+    gradescope_without_labs_example,
+):
+    # given
+    example = gradescope_without_labs_example
+
+    # then
+    assert list(example.assignments) == [
+        a for a in gradescope_example.assignments if not a.startswith("lab")
+    ]
+    assert_gradebook_is_sound(example)
+
+
+def test_remove_assignments_resets_groups(fresh_gradescope_example):
     # when
-    example = GRADESCOPE_EXAMPLE.copy()
+    example = fresh_gradescope_example()
     example.grading_groups = {"homework 01": 1}
 
     example.remove_assignments(example.assignments.starting_with("lab"))
@@ -1082,10 +1340,12 @@ def test_remove_assignments_resets_groups():
     assert example.grading_groups == {}
 
 
-def test_remove_assignments_raises_if_assignment_does_not_exist():
+def test_remove_assignments_raises_if_assignment_does_not_exist(
+    gradescope_example,
+):
     # given
     assignments = ["homework 01", "this aint an assignment"]
-    example = GRADESCOPE_EXAMPLE.copy()
+    example = gradescope_example
 
     # then
     with pytest.raises(KeyError):
@@ -1094,21 +1354,19 @@ def test_remove_assignments_raises_if_assignment_does_not_exist():
 
 # add_assignment -----------------------------------------------------------------------
 
+# the students of parts_gradebook and a new assignment's scores for them.
+# add_assignment only reads what it is given, so the tests share these
+PARTS_STUDENTS = pd.Index(["A1", "A2"])
+NEW_POINTS_EARNED = pd.Series(np.array([10.0, 20.0]), index=PARTS_STUDENTS)
+
 
-def test_add_assignment():
+def test_add_assignment(parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = parts_gradebook
 
-    assignment_points_earned = pd.Series([10, 20], index=["A1", "A2"])
-    assignment_late = pd.Series(
-        [pd.Timedelta(days=2), pd.Timedelta(days=0)], index=["A1", "A2"]
-    )
-    assignment_dropped = pd.Series([False, True], index=["A1", "A2"])
+    assignment_points_earned = NEW_POINTS_EARNED
+    assignment_late = pd.Series(pd.to_timedelta([2, 0], unit="D"), index=PARTS_STUDENTS)
+    assignment_dropped = pd.Series(np.array([False, True]), index=PARTS_STUDENTS)
 
     # when
     gradebook.add_assignment(
@@ -1126,17 +1384,17 @@ def test_add_assignment():
     assert isinstance(gradebook.lateness.index[0], gradelib.Student)
     assert isinstance(gradebook.dropped.index[0], gradelib.Student)
 
+    # the inputs are left as they were
+    assert_array_equal(assignment_points_earned.to_numpy(), [10, 20])
+    assert assignment_points_earned.index is PARTS_STUDENTS
+    assert assignment_dropped.dtype == bool
 
-def test_add_assignment_default_none_dropped_or_late():
+
+def test_add_assignment_default_none_dropped_or_late(parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = parts_gradebook
 
-    assignment_points_earned = pd.Series([10, 20], index=["A1", "A2"])
+    assignment_points_earned = NEW_POINTS_EARNED
 
     # when
     gradebook.add_assignment(
@@ -1150,14 +1408,28 @@ def test_add_assignment_default_none_dropped_or_late():
     assert gradebook.dropped.loc["A1", "new"] == False
 
 
-def test_add_assignment_raises_on_missing_student():
+def test_add_assignment_keeps_the_tables_homogeneous(parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = parts_gradebook
+
+    # when
+    gradebook.add_assignment(
+        "new",
+        NEW_POINTS_EARNED,
+        points_possible=20,
+        dropped=pd.Series(np.array([0, 1]), index=PARTS_STUDENTS),
+    )
+
+    # then
+    assert (gradebook.points_earned.dtypes == float).all()
+    assert (gradebook.dropped.dtypes == bool).all()
+    assert gradebook.dropped.loc["A2", "new"]
+    assert_gradebook_is_sound(gradebook)
+
+
+def test_add_assignment_raises_on_missing_student(parts_gradebook):
+    # given
+    gradebook = parts_gradebook
 
     # A2 is missing
     assignment_points_earned = pd.Series([10], index=["A1"])
@@ -1171,14 +1443,9 @@ def test_add_assignment_raises_on_missing_student():
         )
 
 
-def test_add_assignment_raises_on_unknown_student():
+def test_add_assignment_raises_on_unknown_student(parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = parts_gradebook
 
     # foo is unknown
     assignment_points_earned = pd.Series([10, 20, 30], index=["A1", "A2", "A3"])
@@ -1192,16 +1459,11 @@ def test_add_assignment_raises_on_unknown_student():
         )
 
 
-def test_add_assignment_raises_if_duplicate_name():
+def test_add_assignment_raises_if_duplicate_name(parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = parts_gradebook
 
-    assignment_points_earned = pd.Series([10, 20], index=["A1", "A2"])
+    assignment_points_earned = NEW_POINTS_EARNED
 
     # when
     with pytest.raises(ValueError):
@@ -1215,14 +1477,9 @@ def test_add_assignment_raises_if_duplicate_name():
 # rename_assignments -------------------------------------------------------------------
 
 
-def test_rename_assignments_simple_example():
+def test_rename_assignments_simple_example(parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = parts_gradebook
 
     gradebook.rename_assignments(
         {
@@ -1241,14 +1498,29 @@ def test_rename_assignments_simple_example():
     assert_gradebook_is_sound(gradebook)
 
 
-def test_rename_assignments_raises_error_on_name_clash():
+def test_assignments_reflect_renames_and_additions_after_being_read(parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = parts_gradebook
+    assert list(gradebook.assignments.starting_with("hw01")) == [
+        "hw01",
+        "hw01 - programming",
+    ]
+
+    # when
+    gradebook.rename_assignments({"hw01 - programming": "lab02"})
+    gradebook.add_assignment("hw01 - extra", pd.Series([1, 2], index=["A1", "A2"]), 5)
+
+    # then
+    assert list(gradebook.assignments.starting_with("hw01")) == [
+        "hw01",
+        "hw01 - extra",
+    ]
+    assert list(gradebook.assignments.starting_with("lab")) == ["lab02", "lab01"]
+
+
+def test_rename_assignments_raises_error_on_name_clash(parts_gradebook):
+    # given
+    gradebook = parts_gradebook
 
     with pytest.raises(ValueError):
         gradebook.rename_assignments(
@@ -1256,14 +1528,9 @@ def test_rename_assignments_raises_error_on_name_clash():
         )
 
 
-def test_rename_assignments_allows_swapping_names():
+def test_rename_assignments_allows_swapping_names(parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = parts_gradebook
 
     gradebook.rename_assignments(
         {
@@ -1286,29 +1553,45 @@ def test_rename_assignments_allows_swapping_names():
 # restrict_to_students ---------------------------------------------------------------------
 
 
-def test_restrict_to_students():
+def test_restrict_to_students(fresh_gradescope_example, roster_pids):
     # when
-    example = GRADESCOPE_EXAMPLE.copy()
-    example.restrict_to_students(ROSTER.index)
+    example = fresh_gradescope_example()
+    example.restrict_to_students(roster_pids)
 
     # then
     assert len(example.pids) == 3
     assert_gradebook_is_sound(example)
 
 
-def test_restrict_to_students_raises_if_pid_does_not_exist():
+def test_restrict_to_students_and_assignments_keep_the_labels_shared(
+    fresh_gradescope_example, roster_pids
+):
+    # when
+    example = fresh_gradescope_example()
+    example.restrict_to_students(roster_pids)
+    example.restrict_to_assignments(["homework 02", "homework 01"])
+
+    # then
+    assert list(example.assignments) == ["homework 02", "homework 01"]
+    assert example.dropped.index is example.points_earned.index
+    assert example.lateness.columns is example.points_earned.columns
+    assert example.points_possible.index is example.points_earned.columns
+    assert_gradebook_is_sound(example)
+
+
+def test_restrict_to_students_raises_if_pid_does_not_exist(gradescope_example):
     # given
     pids = ["A12345678", "ADNEDNE00"]
-    example = GRADESCOPE_EXAMPLE.copy()
+    example = gradescope_example
 
     # when
     with pytest.raises(KeyError):
         example.restrict_to_students(pids)
 
 
-def test_restrict_to_students_with_students_objects():
+def test_restrict_to_students_with_students_objects(fresh_gradescope_example):
     # when
-    example = GRADESCOPE_EXAMPLE.copy()
+    example = fresh_gradescope_example()
     example.restrict_to_students(example.students[0:3])
 
     # then
@@ -1319,40 +1602,118 @@ def test_restrict_to_students_with_students_objects():
     assert_gradebook_is_sound(example)
 
 
+# pickling -----------------------------------------------------------------------------
+
+
+def test_gradebook_pickled_by_an_earlier_version_can_be_loaded(examples_directory):
+    # the pickle holds a gradebook with hw02 dropped for A1, a note, and two
+    # groups, saved by gradelib 0.4.3
+    with (examples_directory / "gradebook-pickled-by-0.4.3.pkl").open("rb") as f:
+        gradebook = pickle.load(f)
+
+    assert_gradebook_is_sound(gradebook)
+    assert list(gradebook.students) == ["A1", "A2"]
+    assert list(gradebook.assignments) == ["hw01", "hw02", "lab01"]
+    assert_array_equal(
+        gradebook.dropped.to_numpy(), [[False, True, False], [False, False, False]]
+    )
+    assert gradebook.notes == {Student("A1"): {"drops": ["Hw02 dropped."]}}
+    assert_allclose(gradebook.overall_score.to_numpy(), [0.7, 21 / 130])
+
+
+def test_gradebook_survives_a_pickle_round_trip(parts_gradebook):
+    parts_gradebook.grading_groups = {"homeworks": (["hw01", "hw02"], 1)}
+
+    gradebook = pickle.loads(pickle.dumps(parts_gradebook))
+
+    assert_gradebook_is_sound(gradebook)
+    assert gradebook.points_earned.equals(parts_gradebook.points_earned)
+    assert_allclose(
+        gradebook.overall_score.to_numpy(), parts_gradebook.overall_score.to_numpy()
+    )
+
+
+def test_gradebook_is_pickled_without_its_caches(parts_gradebook):
+    gb = parts_gradebook
+    gb.grading_groups = {"homeworks": (["hw01", "hw02"], 1)}
+    gb.assignments, gb.students, gb.letter_grades
+
+    pickled = pickle.dumps(gb)
+    restored = pickle.loads(pickled)
+
+    assert b"_derived_cache" not in pickled
+    assert restored._derived_cache == {}
+    assert restored._assignments is None
+    assert restored._scale_layout is None
+    assert_allclose(restored.overall_score.to_numpy(), gb.overall_score.to_numpy())
+
+
 # tests: free functions ================================================================
 
 # combine_gradebooks -------------------------------------------------------------------
 
 
-def test_combine_gradebooks_with_restrict_to_students():
+def test_combine_gradebooks_with_restrict_to_students(combined_example):
+    assert "homework 01" in combined_example.assignments
+    assert "midterm exam" in combined_example.assignments
+    assert_gradebook_is_sound(combined_example)
+
+
+def test_combine_gradebooks_keeps_only_the_given_students(
+    combined_example, roster_pids
+):
+    assert combined_example.pids == set(roster_pids)
+
+
+def test_combine_gradebooks_with_restrict_to_students_leaves_inputs_alone(
+    combined_example, gradescope_example, canvas_without_lab_example, roster_pids
+):
+    # the examples are combined by the fixture above, and still hold every student
+    assert len(gradescope_example.pids) > len(roster_pids)
+    assert len(canvas_without_lab_example.pids) > len(roster_pids)
+    assert_gradebook_is_sound(gradescope_example)
+
+
+def test_combine_gradebooks_aligns_students_given_in_a_different_order():
+    # given
+    first = gradebook_from([[1, 2], [3, 4]], ["hw01", "hw02"], [10, 10])
+    second = gradebook_from([[30], [10]], ["lab01"], [40], students=["A2", "A1"])
+    second.mark_dropped([("A1", "lab01")])
+
     # when
-    combined = gradelib.combine_gradebooks(
-        [GRADESCOPE_EXAMPLE, CANVAS_WITHOUT_LAB_EXAMPLE],
-        restrict_to_students=ROSTER.index,
-    )
+    combined = gradelib.combine_gradebooks([first, second])
 
     # then
-    assert "homework 01" in combined.assignments
-    assert "midterm exam" in combined.assignments
+    assert list(combined.assignments) == ["hw01", "hw02", "lab01"]
+    assert combined.points_earned.loc["A1", "lab01"] == 10
+    assert combined.points_earned.loc["A2", "lab01"] == 30
+    assert combined.dropped.loc["A1", "lab01"]
+    assert not combined.dropped.loc["A2", "lab01"]
     assert_gradebook_is_sound(combined)
 
 
-def test_combine_gradebooks_raises_if_duplicate_assignments():
+def test_combine_gradebooks_raises_if_duplicate_assignments(
+    gradescope_example, canvas_example
+):
     # the canvas example and the gradescope example both have lab 01.
     # when
     with pytest.raises(ValueError):
-        gradelib.combine_gradebooks([GRADESCOPE_EXAMPLE, CANVAS_EXAMPLE])
+        gradelib.combine_gradebooks([gradescope_example, canvas_example])
 
 
-def test_combine_gradebooks_raises_if_indices_do_not_match():
+def test_combine_gradebooks_raises_if_indices_do_not_match(
+    gradescope_example, canvas_without_lab_example
+):
     # when
     with pytest.raises(ValueError):
-        gradelib.combine_gradebooks([CANVAS_WITHOUT_LAB_EXAMPLE, GRADESCOPE_EXAMPLE])
+        gradelib.combine_gradebooks([canvas_without_lab_example, gradescope_example])
 
 
-def test_combine_gradebooks_resets_groups():
-    ex_1 = GRADESCOPE_EXAMPLE.copy()
-    ex_2 = CANVAS_WITHOUT_LAB_EXAMPLE.copy()
+def test_combine_gradebooks_resets_groups(
+    fresh_gradescope_example, fresh_canvas_without_lab_example, roster_pids
+):
+    ex_1 = fresh_gradescope_example()
+    ex_2 = fresh_canvas_without_lab_example()
 
     ex_1.grading_groups = {
         "homeworks": (ex_1.assignments.starting_with("home"), 0.5),
@@ -1363,30 +1724,34 @@ def test_combine_gradebooks_resets_groups():
 
     combined = gradelib.combine_gradebooks(
         [ex_1, ex_2],
-        restrict_to_students=ROSTER.index,
+        restrict_to_students=roster_pids,
     )
 
     assert combined.grading_groups == {}
 
 
-def test_combine_gradebooks_uses_existing_options_if_all_the_same():
-    ex_1 = GRADESCOPE_EXAMPLE.copy()
-    ex_2 = CANVAS_WITHOUT_LAB_EXAMPLE.copy()
+def test_combine_gradebooks_uses_existing_options_if_all_the_same(
+    fresh_gradescope_example, fresh_canvas_without_lab_example, roster_pids
+):
+    ex_1 = fresh_gradescope_example()
+    ex_2 = fresh_canvas_without_lab_example()
 
     ex_1.options.lateness_fudge = 789
     ex_2.options.lateness_fudge = 789
 
     combined = gradelib.combine_gradebooks(
         [ex_1, ex_2],
-        restrict_to_students=ROSTER.index,
+        restrict_to_students=roster_pids,
     )
 
     assert combined.options.lateness_fudge == 789
 
 
-def test_combine_gradebooks_raises_if_options_do_not_match():
-    ex_1 = GRADESCOPE_EXAMPLE.copy()
-    ex_2 = CANVAS_WITHOUT_LAB_EXAMPLE.copy()
+def test_combine_gradebooks_raises_if_options_do_not_match(
+    fresh_gradescope_example, fresh_canvas_without_lab_example, roster_pids
+):
+    ex_1 = fresh_gradescope_example()
+    ex_2 = fresh_canvas_without_lab_example()
 
     ex_1.options.lateness_fudge = 5000
     ex_2.options.lateness_fudge = 6000
@@ -1394,44 +1759,48 @@ def test_combine_gradebooks_raises_if_options_do_not_match():
     with pytest.raises(ValueError):
         gradelib.combine_gradebooks(
             [ex_1, ex_2],
-            restrict_to_students=ROSTER.index,
+            restrict_to_students=roster_pids,
         )
 
 
-def test_combine_gradebooks_uses_existing_scales_if_all_the_same():
-    ex_1 = GRADESCOPE_EXAMPLE.copy()
-    ex_2 = CANVAS_WITHOUT_LAB_EXAMPLE.copy()
-
-    import gradelib.scales
+def test_combine_gradebooks_uses_existing_scales_if_all_the_same(
+    fresh_gradescope_example, fresh_canvas_without_lab_example, roster_pids
+):
+    ex_1 = fresh_gradescope_example()
+    ex_2 = fresh_canvas_without_lab_example()
 
     ex_1.scale = gradelib.scales.ROUNDED_DEFAULT_SCALE
     ex_2.scale = gradelib.scales.ROUNDED_DEFAULT_SCALE
 
     combined = gradelib.combine_gradebooks(
         [ex_1, ex_2],
-        restrict_to_students=ROSTER.index,
+        restrict_to_students=roster_pids,
     )
 
     assert combined.scale == gradelib.scales.ROUNDED_DEFAULT_SCALE
 
 
-def test_combine_gradebooks_raises_if_scales_do_not_match():
-    ex_1 = GRADESCOPE_EXAMPLE.copy()
-    ex_2 = CANVAS_WITHOUT_LAB_EXAMPLE.copy()
+def test_combine_gradebooks_raises_if_scales_do_not_match(
+    gradescope_example, fresh_canvas_without_lab_example, roster_pids
+):
+    ex_1 = gradescope_example
+    ex_2 = fresh_canvas_without_lab_example()
 
     ex_2.scale = gradelib.scales.ROUNDED_DEFAULT_SCALE
 
     with pytest.raises(ValueError):
         gradelib.combine_gradebooks(
             [ex_1, ex_2],
-            restrict_to_students=ROSTER.index,
+            restrict_to_students=roster_pids,
         )
 
 
-def test_combine_gradebooks_concatenates_notes():
+def test_combine_gradebooks_concatenates_notes(
+    fresh_gradescope_example, fresh_canvas_without_lab_example, roster_pids
+):
     # when
-    example_1 = GRADESCOPE_EXAMPLE.copy()
-    example_2 = CANVAS_WITHOUT_LAB_EXAMPLE.copy()
+    example_1 = fresh_gradescope_example()
+    example_2 = fresh_canvas_without_lab_example()
 
     example_1.notes = {
         Student("A1"): {"drop": ["foo", "bar"]},
@@ -1445,7 +1814,7 @@ def test_combine_gradebooks_concatenates_notes():
     }
 
     combined = gradelib.combine_gradebooks(
-        [example_1, example_2], restrict_to_students=ROSTER.index
+        [example_1, example_2], restrict_to_students=roster_pids
     )
 
     # then
@@ -1,18 +1,18 @@
 import gradelib
 
-from pytest import raises  # pyright: ignore
+import pytest  # pyright: ignore
 
 
-def test_verifies_that_assignment_weights_add_to_one():
-    with raises(ValueError):
-        gradelib.GradingGroup({"foo": 0.2, "bar": 0.5, "baz": 0.1}, group_weight=0.5)
-
-
-def test_verifies_that_assignment_weights_are_between_0_and_1():
-    with raises(ValueError):
-        gradelib.GradingGroup({"foo": -0.5, "bar": 1.5}, group_weight=0.5)
-
-
-def test_verifies_that_group_weight_is_between_0_and_1():
-    with raises(ValueError):
-        gradelib.GradingGroup({"foo": 0.5, "bar": 0.5}, group_weight=42.0)
+@pytest.mark.parametrize(
+    "assignment_weights, group_weight, message",
+    [
+        ({}, 0.5, "cannot be empty"),
+        ({"foo": 0.2, "bar": 0.5, "baz": 0.1}, 0.5, "must sum to one"),
+        ({"foo": -0.5, "bar": 1.5}, 0.5, "Assignment weights must be between"),
+        ({"foo": 0.5, "bar": 0.5}, 42.0, "Group weight must be between"),
+    ],
+    ids=["empty", "weights-not-summing-to-one", "weight-out-of-range", "group-weight"],
+)
+def test_verifies_weights(assignment_weights, group_weight, message):
+    with pytest.raises(ValueError, match=message):
+        gradelib.GradingGroup(assignment_weights, group_weight=group_weight)
@@ -1,20 +1,25 @@
-import pandas as pd
-import numpy as np
+import pytest  # pyright: ignore
 
-import gradelib
+import numpy as np
+from numpy.testing import assert_array_equal
 
-from util import assert_gradebook_is_sound
+from util import assert_gradebook_is_sound, gradebook_from
 from gradelib.policies.drops import drop_most_favorable
 
 
-def test_drop_most_favorable_with_callable_within():
+@pytest.fixture
+def homeworks_and_lab_gradebook():
+    """Three homeworks of very different sizes and a lab, for two students."""
+    return gradebook_from(
+        [[1, 30, 90, 20], [2, 7, 15, 20]],
+        ["hw01", "hw02", "hw03", "lab01"],
+        [2, 50, 100, 20],
+    )
+
+
+def test_drop_most_favorable_with_callable_within(homeworks_and_lab_gradebook):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points = pd.DataFrame([p1, p2])
-    maximums = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
+    gradebook = homeworks_and_lab_gradebook
     homeworks = gradebook.assignments.starting_with("hw")
 
     gradebook.grading_groups = {"homeworks": (homeworks, 0.75), "lab01": 0.25}
@@ -28,18 +33,13 @@ def test_drop_most_favorable_with_callable_within():
     # then
     assert gradebook.dropped.iloc[0, 1]
     assert gradebook.dropped.iloc[1, 2]
-    assert list(gradebook.dropped.sum(axis=1)) == [1, 1]
+    assert_array_equal(gradebook.dropped.to_numpy().sum(axis=1), [1, 1])
     assert_gradebook_is_sound(gradebook)
 
 
-def test_drop_most_favorable_maximizes_overall_score():
+def test_drop_most_favorable_maximizes_overall_score(homeworks_and_lab_gradebook):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points = pd.DataFrame([p1, p2])
-    maximums = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
+    gradebook = homeworks_and_lab_gradebook
 
     HOMEWORKS = gradebook.assignments.starting_with("hw")
     gradebook.grading_groups = {"homeworks": (HOMEWORKS, 0.75), "lab01": 0.25}
@@ -53,18 +53,13 @@ def test_drop_most_favorable_maximizes_overall_score():
     # then
     assert gradebook.dropped.iloc[0, 1]
     assert gradebook.dropped.iloc[1, 2]
-    assert list(gradebook.dropped.sum(axis=1)) == [1, 1]
+    assert_array_equal(gradebook.dropped.to_numpy().sum(axis=1), [1, 1])
     assert_gradebook_is_sound(gradebook)
 
 
-def test_drop_most_favorable_with_multiple_dropped():
+def test_drop_most_favorable_with_multiple_dropped(homeworks_and_lab_gradebook):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points = pd.DataFrame([p1, p2])
-    maximums = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
+    gradebook = homeworks_and_lab_gradebook
     homeworks = gradebook.assignments.starting_with("hw")
 
     gradebook.grading_groups = {"homeworks": (homeworks, 0.75), "lab01": 0.25}
@@ -78,20 +73,17 @@ def test_drop_most_favorable_with_multiple_dropped():
     # then
     assert not gradebook.dropped.iloc[0, 2]
     assert not gradebook.dropped.iloc[1, 0]
-    assert list(gradebook.dropped.sum(axis=1)) == [2, 2]
+    assert_array_equal(gradebook.dropped.to_numpy().sum(axis=1), [2, 2])
     assert_gradebook_is_sound(gradebook)
 
 
 def test_drop_most_favorable_ignores_assignments_already_dropped():
     # given
     columns = ["hw01", "hw02", "hw03", "hw04"]
-    p1 = pd.Series(data=[9, 0, 7, 0], index=columns, name="A1")
-    p2 = pd.Series(data=[10, 10, 10, 10], index=columns, name="A2")
-    points = pd.DataFrame([p1, p2])
-    maximums = pd.Series([10, 10, 10, 10], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
-    gradebook.dropped.loc["A1", "hw02"] = True
-    gradebook.dropped.loc["A1", "hw04"] = True
+    gradebook = gradebook_from(
+        [[9, 0, 7, 0], [10, 10, 10, 10]], columns, [10, 10, 10, 10]
+    )
+    gradebook.mark_dropped([("A1", "hw02"), ("A1", "hw04")])
 
     gradebook.grading_groups = {
         "homeworks": (gradebook.assignments.starting_with("hw"), 1),
@@ -107,18 +99,15 @@ def test_drop_most_favorable_ignores_assignments_already_dropped():
     assert gradebook.dropped.loc["A1", "hw04"]
     assert gradebook.dropped.loc["A1", "hw02"]
     assert gradebook.dropped.loc["A1", "hw03"]
-    assert list(gradebook.dropped.sum(axis=1)) == [3, 1]
+    assert_array_equal(gradebook.dropped.to_numpy().sum(axis=1), [3, 1])
     assert_gradebook_is_sound(gradebook)
 
 
-def test_drop_most_favorable_with_multiple_dropped_adds_note():
+def test_drop_most_favorable_with_multiple_dropped_adds_note(
+    homeworks_and_lab_gradebook,
+):
     # given
-    columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points = pd.DataFrame([p1, p2])
-    maximums = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
+    gradebook = homeworks_and_lab_gradebook
     homeworks = gradebook.assignments.starting_with("hw")
 
     gradebook.grading_groups = {"homeworks": (homeworks, 0.75), "lab01": 0.25}
@@ -138,10 +127,7 @@ def test_drop_most_favorable_with_multiple_dropped_adds_note():
 def test_drop_most_favorable_treats_nans_as_zeros():
     # given
     columns = ["hw01", "hw02", "hw03", "lab01"]
-    p1 = pd.Series(data=[np.nan, 30, 90, 20], index=columns, name="A1")
-    points = pd.DataFrame([p1])
-    maximums = pd.Series([100, 100, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
+    gradebook = gradebook_from([[np.nan, 30, 90, 20]], columns, [100, 100, 100, 20])
     homeworks = gradebook.assignments.starting_with("hw")
 
     gradebook.grading_groups = {"homeworks": (homeworks, 0.75), "lab01": 0.25}
@@ -3,21 +3,20 @@ import pandas as pd
 import gradelib
 from gradelib.policies.exceptions import make_exceptions, ForgiveLate, Drop, Replace
 
-from util import assert_gradebook_is_sound
+from util import assert_gradebook_is_sound, gradebook_from
+
+STUDENTS = [gradelib.Student("A1", "Justin"), gradelib.Student("A2", "Steve")]
 
 
 def test_make_exceptions_with_forgive_lates():
     # given
-    columns = ["hw01", "hw02", "hw03", "hw04"]
-    p1 = pd.Series(data=[9, 0, 7, 0], index=columns)
-    p2 = pd.Series(data=[10, 10, 10, 10], index=columns)
-    points = pd.DataFrame(
-        [p1, p2],
-        index=[gradelib.Student("A1", "Justin"), gradelib.Student("A2", "Steve")],
+    gradebook = gradebook_from(
+        [[9, 0, 7, 0], [10, 10, 10, 10]],
+        ["hw01", "hw02", "hw03", "hw04"],
+        [10, 10, 10, 10],
+        students=STUDENTS,
     )
-    maximums = pd.Series([10, 10, 10, 10], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
-    gradebook.lateness.loc["A1", "hw01"] = pd.Timedelta(5000, "s")
+    gradebook.lateness.at["A1", "hw01"] = pd.Timedelta(5000, "s")
 
     # when
     make_exceptions(gradebook, "Justin", [ForgiveLate("hw01")])
@@ -29,16 +28,13 @@ def test_make_exceptions_with_forgive_lates():
 
 def test_make_exceptions_with_forgive_lates_adds_note():
     # given
-    columns = ["hw01", "hw02", "hw03", "hw04"]
-    p1 = pd.Series(data=[9, 0, 7, 0], index=columns)
-    p2 = pd.Series(data=[10, 10, 10, 10], index=columns)
-    points = pd.DataFrame(
-        [p1, p2],
-        index=[gradelib.Student("A1", "Justin"), gradelib.Student("A2", "Steve")],
+    gradebook = gradebook_from(
+        [[9, 0, 7, 0], [10, 10, 10, 10]],
+        ["hw01", "hw02", "hw03", "hw04"],
+        [10, 10, 10, 10],
+        students=STUDENTS,
     )
-    maximums = pd.Series([10, 10, 10, 10], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
-    gradebook.lateness.loc["A1", "hw01"] = pd.Timedelta(5000, "s")
+    gradebook.lateness.at["A1", "hw01"] = pd.Timedelta(5000, "s")
 
     # when
     make_exceptions(gradebook, "Justin", [ForgiveLate("hw01")])
@@ -51,15 +47,12 @@ def test_make_exceptions_with_forgive_lates_adds_note():
 
 def test_make_exceptions_with_drop():
     # given
-    columns = ["hw01", "hw02", "hw03", "hw04"]
-    p1 = pd.Series(data=[9, 0, 7, 0], index=columns)
-    p2 = pd.Series(data=[10, 10, 10, 10], index=columns)
-    points = pd.DataFrame(
-        [p1, p2],
-        index=[gradelib.Student("A1", "Justin"), gradelib.Student("A2", "Steve")],
+    gradebook = gradebook_from(
+        [[9, 0, 7, 0], [10, 10, 10, 10]],
+        ["hw01", "hw02", "hw03", "hw04"],
+        [10, 10, 10, 10],
+        students=STUDENTS,
     )
-    maximums = pd.Series([10, 10, 10, 10], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
 
     # when
     make_exceptions(gradebook, "Justin", [Drop("hw01")])
@@ -71,15 +64,12 @@ def test_make_exceptions_with_drop():
 
 def test_make_exceptions_with_drop_adds_note():
     # given
-    columns = ["hw01", "hw02", "hw03", "hw04"]
-    p1 = pd.Series(data=[9, 0, 7, 0], index=columns)
-    p2 = pd.Series(data=[10, 10, 10, 10], index=columns)
-    points = pd.DataFrame(
-        [p1, p2],
-        index=[gradelib.Student("A1", "Justin"), gradelib.Student("A2", "Steve")],
+    gradebook = gradebook_from(
+        [[9, 0, 7, 0], [10, 10, 10, 10]],
+        ["hw01", "hw02", "hw03", "hw04"],
+        [10, 10, 10, 10],
+        students=STUDENTS,
     )
-    maximums = pd.Series([10, 10, 10, 10], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
 
     # when
     make_exceptions(gradebook, "Justin", [Drop("hw01")])
@@ -91,15 +81,12 @@ def test_make_exceptions_with_drop_adds_note():
 
 def test_make_exceptions_with_replace():
     # given
-    columns = ["hw01", "hw02", "hw03", "hw04"]
-    p1 = pd.Series(data=[9, 0, 7, 0], index=columns)
-    p2 = pd.Series(data=[10, 10, 10, 10], index=columns)
-    points = pd.DataFrame(
-        [p1, p2],
-        index=[gradelib.Student("A1", "Justin"), gradelib.Student("A2", "Steve")],
+    gradebook = gradebook_from(
+        [[9, 0, 7, 0], [10, 10, 10, 10]],
+        ["hw01", "hw02", "hw03", "hw04"],
+        [10, 10, 10, 10],
+        students=STUDENTS,
     )
-    maximums = pd.Series([10, 10, 10, 10], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
 
     # when
     make_exceptions(gradebook, "Justin", [Replace("hw02", with_="hw01")])
@@ -112,15 +99,12 @@ def test_make_exceptions_with_replace():
 
 def test_make_exceptions_with_replace_scales_using_points_possible():
     # given
-    columns = ["hw01", "hw02", "hw03", "hw04"]
-    p1 = pd.Series(data=[9, 15, 7, 0], index=columns)
-    p2 = pd.Series(data=[10, 10, 10, 10], index=columns)
-    points = pd.DataFrame(
-        [p1, p2],
-        index=[gradelib.Student("A1", "Justin"), gradelib.Student("A2", "Steve")],
+    gradebook = gradebook_from(
+        [[9, 15, 7, 0], [10, 10, 10, 10]],
+        ["hw01", "hw02", "hw03", "hw04"],
+        [10, 20, 10, 10],
+        students=STUDENTS,
     )
-    maximums = pd.Series([10, 20, 10, 10], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
 
     # when
     make_exceptions(gradebook, "Justin", [Replace("hw01", with_="hw02")])
@@ -133,15 +117,12 @@ def test_make_exceptions_with_replace_scales_using_points_possible():
 
 def test_make_exceptions_with_replace_using_points():
     # given
-    columns = ["hw01", "hw02", "hw03", "hw04"]
-    p1 = pd.Series(data=[9, 0, 7, 0], index=columns)
-    p2 = pd.Series(data=[10, 10, 10, 10], index=columns)
-    points = pd.DataFrame(
-        [p1, p2],
-        index=[gradelib.Student("A1", "Justin"), gradelib.Student("A2", "Steve")],
+    gradebook = gradebook_from(
+        [[9, 0, 7, 0], [10, 10, 10, 10]],
+        ["hw01", "hw02", "hw03", "hw04"],
+        [10, 10, 10, 10],
+        students=STUDENTS,
     )
-    maximums = pd.Series([10, 10, 10, 10], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
 
     # when
     make_exceptions(
@@ -158,15 +139,12 @@ def test_make_exceptions_with_replace_using_points():
 
 def test_make_exceptions_with_replace_using_percentage_of_points_possible():
     # given
-    columns = ["hw01", "hw02", "hw03", "hw04"]
-    p1 = pd.Series(data=[9, 0, 7, 0], index=columns)
-    p2 = pd.Series(data=[10, 10, 10, 10], index=columns)
-    points = pd.DataFrame(
-        [p1, p2],
-        index=[gradelib.Student("A1", "Justin"), gradelib.Student("A2", "Steve")],
+    gradebook = gradebook_from(
+        [[9, 0, 7, 0], [10, 10, 10, 10]],
+        ["hw01", "hw02", "hw03", "hw04"],
+        [10, 10, 10, 10],
+        students=STUDENTS,
     )
-    maximums = pd.Series([10, 10, 10, 10], index=columns)
-    gradebook = gradelib.Gradebook(points, maximums)
 
     # when
     make_exceptions(
@@ -1,25 +1,27 @@
 import pytest  # pyright: ignore
 
+import numpy as np
 import pandas as pd
 
-import gradelib
 from gradelib import Points, Percentage
 from gradelib.policies.lates import penalize, Deduct, Forgive
 
+from util import gradebook_from
+
+
+def _seconds(rows):
+    """A table of lateness given in seconds, one row per student."""
+    return np.array(rows, dtype="timedelta64[s]")
+
 
 def test_with_deduct_percentage():
     # given
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [pd.to_timedelta([0, 0, 5000], "s"), pd.to_timedelta([6000, 0, 0], "s")],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [7, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[0, 0, 5000], [6000, 0, 0]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     penalize(gradebook, policy=Deduct(Percentage(50)))
 
@@ -29,17 +31,12 @@ def test_with_deduct_percentage():
 
 def test_with_deduct_points():
     # given
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [pd.to_timedelta([0, 0, 5000], "s"), pd.to_timedelta([6000, 0, 0], "s")],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [7, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[0, 0, 5000], [6000, 0, 0]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     penalize(gradebook, policy=Deduct(Points(3)))
 
@@ -49,17 +46,12 @@ def test_with_deduct_points():
 
 def test_with_custom_policy():
     # given
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [pd.to_timedelta([6000, 6000, 6000], "s"), pd.to_timedelta([0, 0, 0], "s")],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [7, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[6000, 6000, 6000], [0, 0, 0]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
     gradebook.grading_groups = {
         "homeworks": (["hw01", "hw02"], 0.75),
         "labs": (["lab01"], 0.25),
@@ -84,17 +76,12 @@ def test_with_custom_policy():
 
 def test_respects_lateness_fudge():
     # given
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [pd.to_timedelta([0, 0, 50], "s"), pd.to_timedelta([6000, 0, 0], "s")],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [7, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[0, 0, 50], [6000, 0, 0]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     gradebook.options.lateness_fudge = 60 * 5
 
@@ -105,17 +92,12 @@ def test_respects_lateness_fudge():
 
 def test_within_assignments():
     # given
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [pd.to_timedelta([0, 0, 5000], "s"), pd.to_timedelta([6000, 0, 0], "s")],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [7, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[0, 0, 5000], [6000, 0, 0]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     HOMEWORK = gradebook.assignments.starting_with("hw")
 
@@ -126,17 +108,12 @@ def test_within_assignments():
 
 def test_forgive():
     # given
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [pd.to_timedelta([5000, 0, 5000], "s"), pd.to_timedelta([6000, 0, 0], "s")],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [7, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[5000, 0, 5000], [6000, 0, 0]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     gradebook.grading_groups = {
         "homeworks": (["hw01", "hw02"], 0.75),
@@ -154,17 +131,12 @@ def test_forgive():
 
 def test_with_forgive_and_within():
     # given
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [pd.to_timedelta([5000, 0, 5000], "s"), pd.to_timedelta([6000, 0, 0], "s")],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [7, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[5000, 0, 5000], [6000, 0, 0]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     HOMEWORK = gradebook.assignments.starting_with("hw")
 
@@ -176,20 +148,12 @@ def test_with_forgive_and_within():
 
 def test_assignments_in_descending_order_of_value_by_default():
     # given
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[45, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [
-            pd.to_timedelta([5000, 5000, 5000], "s"),
-            pd.to_timedelta([6000, 5000, 5000], "s"),
-        ],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [45, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[5000, 5000, 5000], [6000, 5000, 5000]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     HOMEWORK = gradebook.assignments.starting_with("hw")
     LABS = gradebook.assignments.starting_with("lab")
@@ -217,20 +181,12 @@ def test_assignments_in_descending_order_of_value_by_default():
 
 def test_order_by_value_works_even_when_value_of_some_assignments_is_nan():
     # given
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[45, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [
-            pd.to_timedelta([5000, 5000, 5000], "s"),
-            pd.to_timedelta([6000, 5000, 5000], "s"),
-        ],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [45, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[5000, 5000, 5000], [6000, 5000, 5000]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     HOMEWORK = gradebook.assignments.starting_with("hw")
     LABS = gradebook.assignments.starting_with("lab")
@@ -258,20 +214,12 @@ def test_order_by_value_works_even_when_value_of_some_assignments_is_nan():
 
 
 def test_order_by_index():
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[45, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [
-            pd.to_timedelta([5000, 5000, 5000], "s"),
-            pd.to_timedelta([6000, 5000, 5000], "s"),
-        ],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [45, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[5000, 5000, 5000], [6000, 5000, 5000]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     HOMEWORK = gradebook.assignments.starting_with("hw")
     LABS = gradebook.assignments.starting_with("lab")
@@ -298,17 +246,12 @@ def test_order_by_index():
 
 
 def test_with_callable_order_by():
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [pd.to_timedelta([5000, 5000, 5000], "s"), pd.to_timedelta([6000, 0, 0], "s")],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [7, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[5000, 5000, 5000], [6000, 0, 0]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     HOMEWORK = gradebook.assignments.starting_with("hw")
 
@@ -336,20 +279,12 @@ def test_with_callable_order_by():
 
 def test_with_empty_assignment_list_raises():
     # given
-    columns = ["hw01", "hw02", "lab01"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[45, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [
-            pd.to_timedelta([5000, 5000, 5000], "s"),
-            pd.to_timedelta([6000, 5000, 5000], "s"),
-        ],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [45, 15, 20]],
+        ["hw01", "hw02", "lab01"],
+        [50, 100, 20],
+        lateness=_seconds([[5000, 5000, 5000], [6000, 5000, 5000]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     # when
     with pytest.raises(ValueError):
@@ -357,27 +292,18 @@ def test_with_empty_assignment_list_raises():
 
 
 def test_takes_into_account_drops():
-    columns = ["hw01", "hw02", "lab01", "lab02"]
-    p1 = pd.Series(data=[30, 90, 20, 1], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20, 1], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20, 20], index=columns)
-    lateness = pd.DataFrame(
-        [
-            pd.to_timedelta([5000, 5000, 5000, 50000], "s"),
-            pd.to_timedelta([6000, 0, 0, 0], "s"),
-        ],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20, 1], [7, 15, 20, 1]],
+        ["hw01", "hw02", "lab01", "lab02"],
+        [50, 100, 20, 20],
+        lateness=_seconds([[5000, 5000, 5000, 50000], [6000, 0, 0, 0]]),
     )
-
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
     gradebook.grading_groups = {
         "homeworks": (gradebook.assignments.starting_with("hw"), 0.75),
         "labs": (gradebook.assignments.starting_with("lab"), 0.25),
     }
 
-    gradebook.dropped.loc["A1", "hw02"] = True
+    gradebook.mark_dropped([("A1", "hw02")])
 
     # after dropping, values from least to greatest
     # A1: hw02, lab02, lab01, hw01
@@ -392,17 +318,12 @@ def test_takes_into_account_drops():
 
 def test_deduct_adds_note_for_penalized_assignment():
     # given
-    columns = ["hw01", "hw02", "hw03"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [pd.to_timedelta([5000, 5000, 5000], "s"), pd.to_timedelta([6000, 0, 0], "s")],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [7, 15, 20]],
+        ["hw01", "hw02", "hw03"],
+        [50, 100, 20],
+        lateness=_seconds([[5000, 5000, 5000], [6000, 0, 0]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     HOMEWORK = gradebook.assignments.starting_with("hw")
 
@@ -428,17 +349,12 @@ def test_deduct_adds_note_for_penalized_assignment():
 
 def test_forgive_adds_note_for_forgiven_assignments():
     # given
-    columns = ["hw01", "hw02", "hw03"]
-    p1 = pd.Series(data=[30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 100, 20], index=columns)
-    lateness = pd.DataFrame(
-        [pd.to_timedelta([5000, 5000, 5000], "s"), pd.to_timedelta([6000, 0, 0], "s")],
-        columns=columns,
-        index=points_earned.index,
+    gradebook = gradebook_from(
+        [[30, 90, 20], [7, 15, 20]],
+        ["hw01", "hw02", "hw03"],
+        [50, 100, 20],
+        lateness=_seconds([[5000, 5000, 5000], [6000, 0, 0]]),
     )
-    gradebook = gradelib.Gradebook(points_earned, points_possible, lateness=lateness)
 
     HOMEWORK = gradebook.assignments.starting_with("hw")
 
@@ -6,167 +6,120 @@ from gradelib import preprocessing
 
 import pytest  # pyright: ignore
 
+from util import gradebook_from
 
-# combine_assignment_parts -------------------------------------------------------------
-
-
-def test_combine_assignment_parts():
-    """test that points_earned / points_possible are added across unified assignments"""
-    # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
-
-    HOMEWORK_01_PARTS = gradebook.assignments.starting_with("hw01")
-
-    # when
-    preprocessing.combine_assignment_parts(gradebook, {"hw01": HOMEWORK_01_PARTS})
-
-    # then
-    assert len(gradebook.assignments) == 3
-    assert gradebook.points_possible["hw01"] == 52
-    assert gradebook.points_earned.loc["A1", "hw01"] == 31
-
-    assert gradebook.points_possible.shape[0] == 3
-    assert gradebook.late.shape[1] == 3
-    assert gradebook.dropped.shape[1] == 3
-    assert gradebook.points_earned.shape[1] == 3
 
+# combine_assignment_parts -------------------------------------------------------------
 
-def test_combine_assignment_parts_with_multiple_in_dictionary():
-    """test that points_earned / points_possible are added across unified assignments"""
-    # given
-    columns = ["hw01", "hw01 - programming", "hw02", "hw02 - testing"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+# the parts of the first homework in hw01_parts_gradebook
+HW01_PARTS = ("hw01", "hw01 - programming")
 
-    HOMEWORK_01_PARTS = gradebook.assignments.starting_with("hw01")
-    HOMEWORK_02_PARTS = gradebook.assignments.starting_with("hw02")
 
-    # when
-    preprocessing.combine_assignment_parts(
-        gradebook, {"hw01": HOMEWORK_01_PARTS, "hw02": HOMEWORK_02_PARTS}
+@pytest.fixture
+def hw01_parts_gradebook():
+    """A gradebook whose first homework has the two parts in HW01_PARTS."""
+    return gradebook_from(
+        [[1, 30, 90, 20], [2, 7, 15, 20]],
+        [*HW01_PARTS, "hw02", "lab01"],
+        [2, 50, 100, 20],
     )
 
-    # then
-    assert len(gradebook.assignments) == 2
-
-    assert gradebook.points_possible["hw01"] == 52
-    assert gradebook.points_earned.loc["A1", "hw01"] == 31
-
-    assert gradebook.points_possible["hw02"] == 120
-    assert gradebook.points_earned.loc["A1", "hw02"] == 110
-
-    assert gradebook.points_possible.shape[0] == 2
-    assert gradebook.late.shape[1] == 2
-    assert gradebook.dropped.shape[1] == 2
-    assert gradebook.points_earned.shape[1] == 2
-
 
-def test_combine_assignment_parts_with_prefixes():
+@pytest.mark.parametrize(
+    "parts, expected_points_possible, expected_points_earned",
+    [
+        (
+            lambda assignments: {"hw01": assignments.starting_with("hw01")},
+            {"hw01": 52, "hw02": 100, "hw02 - testing": 20, "lab 01": 10},
+            {"hw01": 31, "hw02": 90, "hw02 - testing": 20, "lab 01": 10},
+        ),
+        (
+            lambda assignments: {
+                "hw01": assignments.starting_with("hw01"),
+                "hw02": assignments.starting_with("hw02"),
+            },
+            {"hw01": 52, "hw02": 120, "lab 01": 10},
+            {"hw01": 31, "hw02": 110, "lab 01": 10},
+        ),
+        (
+            lambda assignments: assignments.starting_with("hw").group_by(
+                lambda s: s.split(" - ")[0]
+            ),
+            {"hw01": 52, "hw02": 120, "lab 01": 10},
+            {"hw01": 31, "hw02": 110, "lab 01": 10},
+        ),
+    ],
+    ids=["one_in_dictionary", "multiple_in_dictionary", "with_prefixes"],
+)
+def test_combine_assignment_parts(
+    parts, expected_points_possible, expected_points_earned
+):
     """test that points_earned / points_possible are added across unified assignments"""
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "hw02 - testing", "lab 01"]
-    p1 = pd.Series(data=[1, 30, 90, 20, 10], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20, 10], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20, 10], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = gradebook_from(
+        [[1, 30, 90, 20, 10], [2, 7, 15, 20, 10]],
+        ["hw01", "hw01 - programming", "hw02", "hw02 - testing", "lab 01"],
+        [2, 50, 100, 20, 10],
+    )
 
     # when
-    preprocessing.combine_assignment_parts(
-        gradebook,
-        gradebook.assignments.starting_with("hw").group_by(lambda s: s.split(" - ")[0]),
-    )
+    preprocessing.combine_assignment_parts(gradebook, parts(gradebook.assignments))
 
     # then
-    assert len(gradebook.assignments) == 3
+    n_assignments = len(expected_points_possible)
+    assert len(gradebook.assignments) == n_assignments
 
-    assert gradebook.points_possible["hw01"] == 52
-    assert gradebook.points_earned.loc["A1", "hw01"] == 31
+    assert gradebook.points_possible.to_dict() == expected_points_possible
+    assert gradebook.points_earned.loc["A1"].to_dict() == expected_points_earned
 
-    assert gradebook.points_possible["hw02"] == 120
-    assert gradebook.points_earned.loc["A1", "hw02"] == 110
+    assert gradebook.points_possible.shape[0] == n_assignments
+    assert gradebook.late.shape[1] == n_assignments
+    assert gradebook.dropped.shape[1] == n_assignments
+    assert gradebook.points_earned.shape[1] == n_assignments
 
-    assert gradebook.points_possible.shape[0] == 3
-    assert gradebook.late.shape[1] == 3
-    assert gradebook.dropped.shape[1] == 3
-    assert gradebook.points_earned.shape[1] == 3
 
-
-def test_combine_assignment_parts_uses_max_lateness_for_assignment_pieces():
+def test_combine_assignment_parts_uses_max_lateness_for_assignment_pieces(
+    hw01_parts_gradebook,
+):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = hw01_parts_gradebook
 
-    gradebook.lateness.loc["A1", "hw01"] = pd.Timedelta(days=3)
-    gradebook.lateness.loc["A1", "hw01 - programming"] = pd.Timedelta(days=5)
-    HOMEWORK_01_PARTS = gradebook.assignments.starting_with("hw01")
+    gradebook.lateness.loc["A1", list(HW01_PARTS)] = pd.to_timedelta([3, 5], unit="D")
 
     # when
-    preprocessing.combine_assignment_parts(gradebook, {"hw01": HOMEWORK_01_PARTS})
+    preprocessing.combine_assignment_parts(gradebook, {"hw01": HW01_PARTS})
 
     # then
     assert gradebook.lateness.loc["A1", "hw01"] == pd.Timedelta(days=5)
 
 
-def test_combine_assignment_parts_raises_if_any_part_is_dropped():
+def test_combine_assignment_parts_raises_if_any_part_is_dropped(hw01_parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = hw01_parts_gradebook
 
-    gradebook.dropped.loc["A1", "hw01"] = True
-    HOMEWORK_01_PARTS = gradebook.assignments.starting_with("hw01")
+    gradebook.mark_dropped([("A1", "hw01")])
 
     with pytest.raises(ValueError):
-        preprocessing.combine_assignment_parts(gradebook, {"hw01": HOMEWORK_01_PARTS})
+        preprocessing.combine_assignment_parts(gradebook, {"hw01": HW01_PARTS})
 
 
-def test_combine_assignment_parts_copies_attributes():
+def test_combine_assignment_parts_copies_attributes(hw01_parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
-
-    HOMEWORK_01_PARTS = gradebook.assignments.starting_with("hw01")
+    gradebook = hw01_parts_gradebook
 
-    preprocessing.combine_assignment_parts(gradebook, {"hw01": HOMEWORK_01_PARTS})
+    preprocessing.combine_assignment_parts(gradebook, {"hw01": HW01_PARTS})
 
 
-def test_combine_assignment_parts_resets_groups():
+def test_combine_assignment_parts_resets_groups(hw01_parts_gradebook):
     # given
-    columns = ["hw01", "hw01 - programming", "hw02", "lab01"]
-    p1 = pd.Series(data=[1, 30, 90, 20], index=columns, name="A1")
-    p2 = pd.Series(data=[2, 7, 15, 20], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([2, 50, 100, 20], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = hw01_parts_gradebook
     gradebook.grading_groups = {
         "homeworks": ({"hw01": 0.25, "hw01 - programming": 0.25, "hw02": 0.5}, 0.5),
         "labs": ({"lab01": 1}, 0.5),
     }
 
-    HOMEWORK_01_PARTS = gradebook.assignments.starting_with("hw01")
-
     # when
-    preprocessing.combine_assignment_parts(gradebook, {"hw01": HOMEWORK_01_PARTS})
+    preprocessing.combine_assignment_parts(gradebook, {"hw01": HW01_PARTS})
 
     # then
     assert gradebook.grading_groups == {}
@@ -178,11 +131,7 @@ def test_combine_assignment_parts_resets_groups():
 def test_combine_assignment_versions_removes_assignment_versions():
     # given
     columns = ["mt - version a", "mt - version b"]
-    p1 = pd.Series(data=[50, np.nan], index=columns, name="A1")
-    p2 = pd.Series(data=[np.nan, 30], index=columns, name="A2")
-    points_earned = pd.DataFrame([p1, p2])
-    points_possible = pd.Series([50, 50], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = gradebook_from([[50, np.nan], [np.nan, 30]], columns, [50, 50])
 
     # when
     preprocessing.combine_assignment_versions(gradebook, {"midterm": columns})
@@ -194,12 +143,11 @@ def test_combine_assignment_versions_removes_assignment_versions():
 def test_combine_assignment_versions_merges_points():
     # given
     columns = ["mt - version a", "mt - version b", "mt - version c"]
-    p1 = pd.Series(data=[50, np.nan, np.nan], index=columns, name="A1")
-    p2 = pd.Series(data=[np.nan, 30, np.nan], index=columns, name="A2")
-    p3 = pd.Series(data=[np.nan, np.nan, 40], index=columns, name="A3")
-    points_earned = pd.DataFrame([p1, p2, p3])
-    points_possible = pd.Series([50, 50, 40], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = gradebook_from(
+        [[50, np.nan, np.nan], [np.nan, 30, np.nan], [np.nan, np.nan, 40]],
+        columns,
+        [50, 50, 40],
+    )
 
     # when
     preprocessing.combine_assignment_versions(gradebook, {"midterm": columns})
@@ -213,14 +161,13 @@ def test_combine_assignment_versions_merges_points():
 def test_combine_assignment_versions_raises_if_any_dropped():
     # given
     columns = ["mt - version a", "mt - version b", "mt - version c"]
-    p1 = pd.Series(data=[50, np.nan, np.nan], index=columns, name="A1")
-    p2 = pd.Series(data=[np.nan, 30, np.nan], index=columns, name="A2")
-    p3 = pd.Series(data=[np.nan, np.nan, 40], index=columns, name="A3")
-    points_earned = pd.DataFrame([p1, p2, p3])
-    points_possible = pd.Series([50, 50, 40], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = gradebook_from(
+        [[50, np.nan, np.nan], [np.nan, 30, np.nan], [np.nan, np.nan, 40]],
+        columns,
+        [50, 50, 40],
+    )
 
-    gradebook.dropped.loc["A1", "mt - version a"] = True
+    gradebook.mark_dropped([("A1", "mt - version a")])
 
     # when
     with pytest.raises(ValueError):
@@ -230,12 +177,11 @@ def test_combine_assignment_versions_raises_if_any_dropped():
 def test_combine_assignment_versions_raises_if_points_earned_in_multiple_versions():
     # given
     columns = ["mt - version a", "mt - version b", "mt - version c", "homework"]
-    p1 = pd.Series(data=[50, 20, np.nan, 10], index=columns, name="A1")
-    p2 = pd.Series(data=[np.nan, 30, np.nan, 10], index=columns, name="A2")
-    p3 = pd.Series(data=[np.nan, np.nan, 40, 10], index=columns, name="A3")
-    points_earned = pd.DataFrame([p1, p2, p3])
-    points_possible = pd.Series([50, 50, 40, 10], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = gradebook_from(
+        [[50, 20, np.nan, 10], [np.nan, 30, np.nan, 10], [np.nan, np.nan, 40, 10]],
+        columns,
+        [50, 50, 40, 10],
+    )
 
     # when
     with pytest.raises(ValueError):
@@ -244,13 +190,11 @@ def test_combine_assignment_versions_raises_if_points_earned_in_multiple_version
 
 def test_combine_assignment_versions_doesnt_raise_if_only_one_assignment_version_turned_int():
     # given
-    columns = ["mt - version a", "mt - version b", "mt - version c", "homework"]
-    p1 = pd.Series(data=[50, np.nan, np.nan, 10], index=columns, name="A1")
-    p2 = pd.Series(data=[np.nan, 30, np.nan, 10], index=columns, name="A2")
-    p3 = pd.Series(data=[np.nan, np.nan, 40, 10], index=columns, name="A3")
-    points_earned = pd.DataFrame([p1, p2, p3])
-    points_possible = pd.Series([50, 50, 50, 10], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
+    gradebook = gradebook_from(
+        [[50, np.nan, np.nan, 10], [np.nan, 30, np.nan, 10], [np.nan, np.nan, 40, 10]],
+        ["mt - version a", "mt - version b", "mt - version c", "homework"],
+        [50, 50, 50, 10],
+    )
 
     # when
     PARTS = gradebook.assignments.starting_with("mt")
@@ -263,15 +207,15 @@ def test_combine_assignment_versions_doesnt_raise_if_only_one_assignment_version
 def test_combine_assignment_versions_uses_lateness_of_turned_in_version():
     # given
     columns = ["mt - version a", "mt - version b", "mt - version c"]
-    p1 = pd.Series(data=[50, np.nan, np.nan], index=columns, name="A1")
-    p2 = pd.Series(data=[np.nan, 30, np.nan], index=columns, name="A2")
-    p3 = pd.Series(data=[np.nan, np.nan, 40], index=columns, name="A3")
-    points_earned = pd.DataFrame([p1, p2, p3])
-    points_possible = pd.Series([50, 50, 40], index=columns)
-    gradebook = gradelib.Gradebook(points_earned, points_possible)
-
-    gradebook.lateness.loc["A1", "mt - version a"] = pd.Timedelta(days=3)
-    gradebook.lateness.loc["A2", "mt - version b"] = pd.Timedelta(days=2)
+    gradebook = gradebook_from(
+        [[50, np.nan, np.nan], [np.nan, 30, np.nan], [np.nan, np.nan, 40]],
+        columns,
+        [50, 50, 40],
+    )
+
+    gradebook.lateness.loc[
+        ["A1", "A2"], ["mt - version a", "mt - version b"]
+    ] = np.array([[3, 0], [0, 2]], dtype="timedelta64[D]")
 
     # when
     preprocessing.combine_assignment_versions(gradebook, {"mt": columns})
@@ -1,6 +1,7 @@
 import gradelib
 
 import pandas as pd
+from numpy.testing import assert_array_equal
 
 
 def test_map_score_to_letter_grade_on_example():
@@ -11,6 +12,16 @@ def test_map_score_to_letter_grade_on_example():
     letters = gradelib.scales.map_scores_to_letter_grades(scores)
 
     # then
-    letters.iloc[0] = "B"
-    letters.iloc[1] = "A"
-    letters.iloc[2] = "F"
+    assert_array_equal(letters.to_numpy(), ["B", "A", "F"])
+
+
+def test_map_score_to_letter_grade_at_thresholds_and_for_missing_scores():
+    # given
+    scores = pd.Series(data=[0.97, 0.9699, 0.6, 0.0, -0.1, float("nan")])
+
+    # when
+    letters = gradelib.scales.map_scores_to_letter_grades(scores)
+
+    # then
+    assert_array_equal(letters.to_numpy(), ["A+", "A", "D", "F", "F", "F"])
+    assert letters.index.equals(scores.index)
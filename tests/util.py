@@ -1,11 +1,33 @@
+import numpy as np
+
+import gradelib
+
+
 def assert_gradebook_is_sound(gradebook):
-    assert (
-        gradebook.points_earned.shape
-        == gradebook.dropped.shape
-        == gradebook.lateness.shape
+    """Check the invariants relating a gradebook's tables to one another."""
+    points_earned = gradebook.points_earned
+    for table in (gradebook.dropped, gradebook.lateness):
+        assert table.shape == points_earned.shape
+        assert table.columns.equals(points_earned.columns)
+        assert table.index.equals(points_earned.index)
+    assert gradebook.points_possible.index.equals(points_earned.columns)
+
+    assert gradebook.dropped.to_numpy().dtype == np.bool_
+
+    # tables should be backed by a single contiguous block, in either order
+    array = points_earned.to_numpy()
+    assert array.flags.c_contiguous or array.flags.f_contiguous
+
+
+def gradebook_from(rows, columns, points_possible, students=None, **kwargs):
+    """Build a gradebook with the given rows of scores, one row per student.
+
+    The students default to A1, A2, ... Any other keyword arguments, such as
+    `lateness`, are passed on to :meth:`gradelib.Gradebook.from_arrays`.
+
+    """
+    if students is None:
+        students = [f"A{i + 1}" for i in range(len(rows))]
+    return gradelib.Gradebook.from_arrays(
+        rows, points_possible, students, columns, **kwargs
     )
-    assert (gradebook.points_earned.columns == gradebook.dropped.columns).all()
-    assert (gradebook.points_earned.columns == gradebook.lateness.columns).all()
-    assert (gradebook.points_earned.index == gradebook.dropped.index).all()
-    assert (gradebook.points_earned.index == gradebook.lateness.index).all()
-    assert (gradebook.points_earned.columns == gradebook.points_possible.index).all()